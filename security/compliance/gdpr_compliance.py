@@ -8,12 +8,16 @@ consent tracking, data processing logging, and privacy controls.
 import json
 import hashlib
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import heapq
+import numpy as np
 from cryptography.fernet import Fernet
 import base64
 
@@ -83,25 +87,88 @@ class ProcessingActivity(Enum):
     DESTRUCTION = "destruction"
 
 
-@dataclass
+# Enum .value goes through a DynamicClassAttribute descriptor on every
+# access; cache it as a plain attribute (sv = "string value") for the
+# report/aggregation paths that touch it per record.
+for _enum in (DataCategory, LegalBasis, ConsentStatus, DataSubjectRight,
+              ProcessingActivity):
+    for _member in _enum:
+        _member.sv = _member.value
+del _enum, _member
+
+
+# Canonical instances of the handful of purpose/processor strings that are
+# otherwise duplicated across millions of records. Interning lets equality
+# checks (e.g. in check_consent) short-circuit on object identity and keeps
+# one shared string object per distinct value.
+_STRING_INTERN: Dict[str, str] = {}
+
+
+def intern(s: str) -> str:
+    """Return the canonical interned instance of *s*."""
+    return _STRING_INTERN.setdefault(s, s)
+
+
+# Timestamps are stored on records as integer epoch microseconds (UTC):
+# int compares are far cheaper than datetime compares on the report and
+# validity hot paths, and the columnar log store keeps them as int64.
+# Naive datetimes are treated as UTC, matching datetime.utcnow() usage
+# throughout this module; datetime objects only exist at the API boundary.
+
+def _now_us() -> int:
+    """Current UTC time as integer epoch microseconds."""
+    return int(time.time() * 1_000_000)
+
+
+def _to_us(dt: Optional[datetime]) -> Optional[int]:
+    """Convert a (naive-UTC or aware) datetime to epoch microseconds."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_us(us: Optional[int]) -> Optional[datetime]:
+    """Convert epoch microseconds back to a naive UTC datetime."""
+    if us is None:
+        return None
+    return datetime.utcfromtimestamp(us / 1_000_000)
+
+
+def _us_property(attr: str) -> property:
+    """Expose an epoch-microsecond slot as a lazily-converted datetime."""
+    def fget(self):
+        return _from_us(getattr(self, attr))
+
+    def fset(self, value):
+        setattr(self, attr, _to_us(value) if isinstance(value, datetime) else value)
+
+    return property(fget, fset)
+
+
+@dataclass(slots=True)
 class DataSubject:
     """Represents a data subject (individual whose data is processed)"""
     subject_id: str
     email: Optional[str] = None
     phone: Optional[str] = None
     name: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_us: int = field(default_factory=_now_us)
+    updated_at_us: int = field(default_factory=_now_us)
     is_child: bool = False  # Under 16 years old
     country: Optional[str] = None
     preferred_language: str = "en"
-    
+
+    created_at = _us_property('created_at_us')
+    updated_at = _us_property('updated_at_us')
+
     def __post_init__(self):
         if not self.subject_id:
             self.subject_id = str(uuid.uuid4())
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsentRecord:
     """Records consent given by data subjects"""
     consent_id: str
@@ -109,38 +176,56 @@ class ConsentRecord:
     purpose: str
     legal_basis: LegalBasis
     status: ConsentStatus
-    given_at: Optional[datetime] = None
-    withdrawn_at: Optional[datetime] = None
-    expires_at: Optional[datetime] = None
+    given_at_us: Optional[int] = None
+    withdrawn_at_us: Optional[int] = None
+    expires_at_us: Optional[int] = None
     consent_method: str = "web_form"  # web_form, email, phone, paper
     consent_text: str = ""
     version: str = "1.0"
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     evidence: Dict[str, Any] = field(default_factory=dict)
-    
+
+    given_at = _us_property('given_at_us')
+    withdrawn_at = _us_property('withdrawn_at_us')
+    expires_at = _us_property('expires_at_us')
+
     def __post_init__(self):
         if not self.consent_id:
             self.consent_id = str(uuid.uuid4())
-    
+        self.purpose = intern(self.purpose)
+
     def is_valid(self) -> bool:
         """Check if consent is currently valid"""
         if self.status != ConsentStatus.GIVEN:
             return False
-        
-        if self.expires_at and datetime.utcnow() > self.expires_at:
+
+        if self.expires_at_us and _now_us() > self.expires_at_us:
             return False
-        
+
         return True
-    
+
     def withdraw(self, reason: str = "User request"):
         """Withdraw consent"""
         self.status = ConsentStatus.WITHDRAWN
-        self.withdrawn_at = datetime.utcnow()
+        self.withdrawn_at_us = _now_us()
         self.evidence['withdrawal_reason'] = reason
 
+    @classmethod
+    def count_valid(cls, records, now: datetime = None) -> int:
+        """Count currently valid consents in bulk.
+
+        Inlines the ``is_valid`` predicate with the enum member and clock
+        bound to locals, avoiding one method call plus repeated global/attr
+        lookups per record on large report aggregations.
+        """
+        now_us = _now_us() if now is None else _to_us(now)
+        given = ConsentStatus.GIVEN
+        return sum(1 for c in records
+                   if c.status is given and (c.expires_at_us is None or now_us < c.expires_at_us))
 
-@dataclass
+
+@dataclass(slots=True)
 class PersonalDataRecord:
     """Records personal data being processed"""
     record_id: str
@@ -152,27 +237,42 @@ class PersonalDataRecord:
     controller: str
     processor: Optional[str] = None
     retention_period: Optional[timedelta] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
-    expires_at: Optional[datetime] = None
+    created_at_us: int = field(default_factory=_now_us)
+    updated_at_us: int = field(default_factory=_now_us)
+    expires_at_us: Optional[int] = None
     location: str = "EU"  # Data location
     third_countries: List[str] = field(default_factory=list)
     safeguards: List[str] = field(default_factory=list)
     is_encrypted: bool = True
-    
+
+    created_at = _us_property('created_at_us')
+    updated_at = _us_property('updated_at_us')
+    expires_at = _us_property('expires_at_us')
+
     def __post_init__(self):
         if not self.record_id:
             self.record_id = str(uuid.uuid4())
-        
-        if self.retention_period and not self.expires_at:
-            self.expires_at = self.created_at + self.retention_period
-    
+        self.purpose = intern(self.purpose)
+        if self.processor is not None:
+            self.processor = intern(self.processor)
+
+        if self.retention_period and not self.expires_at_us:
+            self.expires_at_us = self.created_at_us + int(
+                self.retention_period.total_seconds() * 1_000_000)
+
     def is_expired(self) -> bool:
         """Check if data retention period has expired"""
-        return self.expires_at and datetime.utcnow() > self.expires_at
+        return self.expires_at_us is not None and _now_us() > self.expires_at_us
 
+    @classmethod
+    def count_expired(cls, records, now: datetime = None) -> int:
+        """Count expired records in bulk with the predicate inlined."""
+        now_us = _now_us() if now is None else _to_us(now)
+        return sum(1 for r in records
+                   if r.expires_at_us is not None and now_us > r.expires_at_us)
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessingLog:
     """Logs data processing activities for audit trail"""
     log_id: str
@@ -182,28 +282,160 @@ class ProcessingLog:
     legal_basis: LegalBasis
     data_categories: List[DataCategory]
     processor: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_us: int = field(default_factory=_now_us)
     details: Dict[str, Any] = field(default_factory=dict)
     automated: bool = False
-    
+
+    timestamp = _us_property('timestamp_us')
+
     def __post_init__(self):
         if not self.log_id:
             self.log_id = str(uuid.uuid4())
+        self.purpose = intern(self.purpose)
+        self.processor = intern(self.processor)
+
+
+# Ordinal codes for the columnar activity array; ProcessingActivity is a
+# str-valued enum, so each member is coded by its declaration-order position.
+_ACTIVITY_CODES = {activity: code for code, activity in enumerate(ProcessingActivity)}
+_ACTIVITIES_BY_CODE = tuple(ProcessingActivity)
+
+
+def _subject_hash(subject_id: str) -> int:
+    """64-bit (process-stable) hash used for columnar subject filtering."""
+    return hash(subject_id) & 0xFFFFFFFFFFFFFFFF
+
+
+class _LogChunk:
+    """One fixed-size block of columnar log storage."""
+
+    __slots__ = ('ts', 'subject_hash', 'activity', 'purpose_id', 'payload', 'size')
+
+    def __init__(self, capacity: int):
+        self.ts = np.empty(capacity, dtype=np.int64)  # epoch microseconds
+        self.subject_hash = np.empty(capacity, dtype=np.uint64)
+        self.activity = np.empty(capacity, dtype=np.uint8)
+        self.purpose_id = np.empty(capacity, dtype=np.uint32)
+        # Fields that do not vectorize (ids, enums, dicts) stay in a compact
+        # per-entry tuple, expanded into dataclasses only on demand.
+        self.payload: List[Tuple] = []
+        self.size = 0
+
+
+class ProcessingLogStore:
+    """Columnar (structure-of-arrays) store for processing log entries.
+
+    Audit logs are append-only and queried in aggregate (time windows,
+    per-subject filters), so the hot fields live in parallel NumPy arrays
+    instead of one Python object per entry. Storage is a chain of fixed-size
+    chunks: appends fill the tail chunk in place and never reallocate or
+    copy earlier entries. Timestamps arrive in monotonically increasing
+    order, which lets window queries skip whole chunks and binary-search
+    (``np.searchsorted``) within the first relevant one. Full
+    ``ProcessingLog`` dataclasses are materialized lazily, only when a
+    caller actually iterates entries.
+
+    With ``max_chunks`` set the chain acts as a ring buffer: once full, the
+    oldest chunk is dropped for each new one. The default keeps every entry.
+    """
+
+    _CHUNK_SIZE = 4096
+
+    def __init__(self, max_chunks: Optional[int] = None):
+        self._chunks: List[_LogChunk] = [_LogChunk(self._CHUNK_SIZE)]
+        self._max_chunks = max_chunks
+        self._purpose_ids: Dict[str, int] = {}
+        self._purposes: List[str] = []
+
+    def __len__(self) -> int:
+        return sum(chunk.size for chunk in self._chunks)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            for offset in range(chunk.size):
+                yield self._materialize(chunk, offset)
+
+    def append(self, log: ProcessingLog) -> None:
+        """Append a log entry, splitting it into its columnar fields."""
+        chunk = self._chunks[-1]
+        if chunk.size == self._CHUNK_SIZE:
+            chunk = _LogChunk(self._CHUNK_SIZE)
+            self._chunks.append(chunk)
+            if self._max_chunks and len(self._chunks) > self._max_chunks:
+                del self._chunks[0]
+        offset = chunk.size
+        chunk.ts[offset] = log.timestamp_us
+        chunk.subject_hash[offset] = _subject_hash(log.subject_id)
+        chunk.activity[offset] = _ACTIVITY_CODES[log.activity]
+        chunk.purpose_id[offset] = self._intern_purpose(log.purpose)
+        chunk.payload.append((log.log_id, log.subject_id, log.legal_basis,
+                              log.data_categories, log.processor, log.details,
+                              log.automated))
+        chunk.size += 1
+
+    def entries_since(self, cutoff: datetime,
+                      subject_id: Optional[str] = None) -> List[ProcessingLog]:
+        """Return entries newer than *cutoff*, optionally for one subject."""
+        cutoff_ts = _to_us(cutoff)
+        target_hash = _subject_hash(subject_id) if subject_id is not None else None
+        logs: List[ProcessingLog] = []
+
+        for chunk in self._chunks:
+            if chunk.size == 0 or chunk.ts[chunk.size - 1] <= cutoff_ts:
+                continue  # Entire chunk is older than the window
+            start = int(np.searchsorted(chunk.ts[:chunk.size],
+                                        cutoff_ts, side='right'))
+            offsets = np.arange(start, chunk.size)
+            if target_hash is not None:
+                offsets = offsets[chunk.subject_hash[start:chunk.size] == target_hash]
+            logs.extend(self._materialize(chunk, int(o)) for o in offsets)
 
+        if subject_id is not None:
+            # Guard against (rare) 64-bit hash collisions.
+            logs = [log for log in logs if log.subject_id == subject_id]
+        return logs
 
-@dataclass
+    def _intern_purpose(self, purpose: str) -> int:
+        purpose_id = self._purpose_ids.get(purpose)
+        if purpose_id is None:
+            purpose_id = len(self._purposes)
+            self._purpose_ids[purpose] = purpose_id
+            self._purposes.append(purpose)
+        return purpose_id
+
+    def _materialize(self, chunk: _LogChunk, offset: int) -> ProcessingLog:
+        (log_id, subject_id, legal_basis, data_categories,
+         processor, details, automated) = chunk.payload[offset]
+        return ProcessingLog(
+            log_id=log_id,
+            subject_id=subject_id,
+            activity=_ACTIVITIES_BY_CODE[int(chunk.activity[offset])],
+            purpose=self._purposes[int(chunk.purpose_id[offset])],
+            legal_basis=legal_basis,
+            data_categories=data_categories,
+            processor=processor,
+            timestamp_us=int(chunk.ts[offset]),
+            details=details,
+            automated=automated
+        )
+
+
+@dataclass(slots=True)
 class DataSubjectRequest:
     """Represents a data subject rights request"""
     request_id: str
     subject_id: str
     right_type: DataSubjectRight
     status: str = "pending"  # pending, in_progress, completed, rejected
-    request_date: datetime = field(default_factory=datetime.utcnow)
-    completion_date: Optional[datetime] = None
+    request_date_us: int = field(default_factory=_now_us)
+    completion_date_us: Optional[int] = None
     details: Dict[str, Any] = field(default_factory=dict)
     requester_verification: bool = False
     response_data: Optional[Dict[str, Any]] = None
-    
+
+    request_date = _us_property('request_date_us')
+    completion_date = _us_property('completion_date_us')
+
     def __post_init__(self):
         if not self.request_id:
             self.request_id = str(uuid.uuid4())
@@ -238,6 +470,31 @@ class DataProcessor(ABC):
         pass
 
 
+# Field layout per data category, flattened once at import into a reverse
+# field->category map and an all-fields set so membership tests and
+# category joins run as C-level set operations instead of nested loops.
+_CATEGORY_FIELDS: Dict[DataCategory, List[str]] = {
+    DataCategory.PERSONAL_IDENTIFIERS: ['name', 'first_name', 'last_name', 'ssn', 'id_number'],
+    DataCategory.CONTACT_INFORMATION: ['email', 'phone', 'address', 'city', 'postal_code'],
+    DataCategory.FINANCIAL_DATA: ['credit_card', 'bank_account', 'payment_method'],
+    DataCategory.LOCATION_DATA: ['ip_address', 'gps_coordinates', 'country', 'region'],
+    DataCategory.BEHAVIORAL_DATA: ['preferences', 'browsing_history', 'search_history'],
+    DataCategory.HEALTH_DATA: ['medical_records', 'health_status', 'medications'],
+    DataCategory.EMPLOYMENT_DATA: ['job_title', 'company', 'salary', 'performance_review'],
+    DataCategory.EDUCATIONAL_DATA: ['education_level', 'qualifications', 'certifications'],
+    DataCategory.BIOMETRIC_DATA: ['fingerprint', 'face_id', 'voice_print'],
+    DataCategory.SPECIAL_CATEGORY: ['race', 'religion', 'political_opinion', 'sexual_orientation']
+}
+
+_FIELD_TO_CATEGORY: Dict[str, DataCategory] = {
+    field_name: category
+    for category, field_names in _CATEGORY_FIELDS.items()
+    for field_name in field_names
+}
+
+_ALL_PERSONAL_FIELDS: frozenset = frozenset(_FIELD_TO_CATEGORY)
+
+
 class DatabaseDataProcessor(DataProcessor):
     """Database implementation of data processor"""
     
@@ -251,62 +508,58 @@ class DatabaseDataProcessor(DataProcessor):
     
     def update_personal_data(self, subject_id: str, updates: Dict[str, Any]) -> bool:
         """Update personal data for a subject"""
-        try:
-            if subject_id not in self.data_store:
-                self.data_store[subject_id] = {}
-            
-            self.data_store[subject_id].update(updates)
-            self.data_store[subject_id]['last_updated'] = datetime.utcnow().isoformat()
-            return True
-        except Exception as e:
-            logging.error(f"Failed to update data for subject {subject_id}: {e}")
+        # Plain dict operations cannot fail here, so validate inputs up front
+        # (look before you leap) instead of paying for exception machinery on
+        # every call.
+        if not subject_id or not isinstance(updates, dict):
+            logging.error(f"Invalid update request for subject {subject_id}")
             return False
-    
+
+        record = self.data_store.setdefault(subject_id, {})
+        record.update(updates)
+        record['last_updated'] = datetime.utcnow().isoformat()
+        return True
+
     def delete_personal_data(self, subject_id: str, categories: List[DataCategory] = None) -> bool:
         """Delete personal data for a subject"""
-        try:
-            if subject_id in self.data_store:
-                if categories:
-                    # Delete specific categories
-                    for category in categories:
-                        category_fields = self._get_fields_for_category(category)
-                        for field in category_fields:
-                            self.data_store[subject_id].pop(field, None)
-                else:
-                    # Delete all data
-                    del self.data_store[subject_id]
+        record = self.data_store.get(subject_id)
+        if record is None:
             return True
-        except Exception as e:
-            logging.error(f"Failed to delete data for subject {subject_id}: {e}")
-            return False
-    
+
+        if categories:
+            # Delete specific categories: join stored keys against the
+            # category fields with a set intersection instead of probing
+            # each field individually.
+            category_fields = frozenset().union(
+                *(_CATEGORY_FIELDS.get(category, []) for category in categories))
+            for field in record.keys() & category_fields:
+                del record[field]
+        else:
+            # Delete all data
+            del self.data_store[subject_id]
+        return True
+
     def anonymize_personal_data(self, subject_id: str, categories: List[DataCategory] = None) -> bool:
         """Anonymize personal data for a subject"""
-        try:
-            if subject_id not in self.data_store:
-                return True
-            
-            anonymized_id = hashlib.sha256(subject_id.encode()).hexdigest()[:16]
-            
-            if categories:
-                # Anonymize specific categories
-                for category in categories:
-                    category_fields = self._get_fields_for_category(category)
-                    for field in category_fields:
-                        if field in self.data_store[subject_id]:
-                            self.data_store[subject_id][field] = f"ANONYMIZED_{anonymized_id}"
-            else:
-                # Anonymize all personal identifiers
-                personal_fields = ['name', 'email', 'phone', 'address', 'ssn']
-                for field in personal_fields:
-                    if field in self.data_store[subject_id]:
-                        self.data_store[subject_id][field] = f"ANONYMIZED_{anonymized_id}"
-            
-            self.data_store[subject_id]['anonymized_at'] = datetime.utcnow().isoformat()
+        record = self.data_store.get(subject_id)
+        if record is None:
             return True
-        except Exception as e:
-            logging.error(f"Failed to anonymize data for subject {subject_id}: {e}")
-            return False
+
+        anonymized_id = hashlib.sha256(subject_id.encode()).hexdigest()[:16]
+
+        if categories:
+            # Anonymize specific categories
+            target_fields = frozenset().union(
+                *(_CATEGORY_FIELDS.get(category, []) for category in categories))
+        else:
+            # Anonymize all personal identifiers
+            target_fields = _ALL_PERSONAL_FIELDS
+
+        for field in record.keys() & target_fields:
+            record[field] = f"ANONYMIZED_{anonymized_id}"
+
+        record['anonymized_at'] = datetime.utcnow().isoformat()
+        return True
     
     def export_personal_data(self, subject_id: str, format: str = "json") -> bytes:
         """Export personal data in portable format"""
@@ -328,19 +581,7 @@ class DatabaseDataProcessor(DataProcessor):
     
     def _get_fields_for_category(self, category: DataCategory) -> List[str]:
         """Get database fields for a data category"""
-        category_mapping = {
-            DataCategory.PERSONAL_IDENTIFIERS: ['name', 'first_name', 'last_name', 'ssn', 'id_number'],
-            DataCategory.CONTACT_INFORMATION: ['email', 'phone', 'address', 'city', 'postal_code'],
-            DataCategory.FINANCIAL_DATA: ['credit_card', 'bank_account', 'payment_method'],
-            DataCategory.LOCATION_DATA: ['ip_address', 'gps_coordinates', 'country', 'region'],
-            DataCategory.BEHAVIORAL_DATA: ['preferences', 'browsing_history', 'search_history'],
-            DataCategory.HEALTH_DATA: ['medical_records', 'health_status', 'medications'],
-            DataCategory.EMPLOYMENT_DATA: ['job_title', 'company', 'salary', 'performance_review'],
-            DataCategory.EDUCATIONAL_DATA: ['education_level', 'qualifications', 'certifications'],
-            DataCategory.BIOMETRIC_DATA: ['fingerprint', 'face_id', 'voice_print'],
-            DataCategory.SPECIAL_CATEGORY: ['race', 'religion', 'political_opinion', 'sexual_orientation']
-        }
-        return category_mapping.get(category, [])
+        return _CATEGORY_FIELDS.get(category, [])
 
 
 class GDPRComplianceManager:
@@ -351,15 +592,35 @@ class GDPRComplianceManager:
         self.subjects: Dict[str, DataSubject] = {}
         self.consent_records: Dict[str, ConsentRecord] = {}
         self.personal_data_records: Dict[str, PersonalDataRecord] = {}
-        self.processing_logs: List[ProcessingLog] = []
+        self.processing_logs = ProcessingLogStore()
         self.subject_requests: Dict[str, DataSubjectRequest] = {}
+
+        # Min-heap of (expires_at_us, record_id) so expiry sweeps pop only
+        # records actually past their TTL instead of scanning every record.
+        self._expiry_heap: List[Tuple[int, str]] = []
         
         # Encryption for sensitive data
         self.encryption_key = Fernet.generate_key()
         self.cipher_suite = Fernet(self.encryption_key)
+
+        # Shared pool for I/O-bound processor calls (per-category erasure
+        # against a real database serializes needlessly otherwise).
+        self._io_pool = ThreadPoolExecutor(max_workers=8,
+                                           thread_name_prefix="gdpr-io")
         
         # Configure logging
         self.logger = logging.getLogger(__name__)
+
+        # Dispatch table for subject rights requests: a single dict lookup
+        # instead of an if/elif chain, and pluggable for specialized handlers.
+        self._request_handlers = {
+            DataSubjectRight.ACCESS: self._handle_access_request,
+            DataSubjectRight.RECTIFICATION: self._handle_rectification_request,
+            DataSubjectRight.ERASURE: self._handle_erasure_request,
+            DataSubjectRight.DATA_PORTABILITY: self._handle_portability_request,
+            DataSubjectRight.RESTRICT_PROCESSING: self._handle_restriction_request,
+            DataSubjectRight.OBJECT: self._handle_objection_request,
+        }
     
     def register_data_subject(self, subject: DataSubject) -> str:
         """Register a new data subject"""
@@ -370,7 +631,7 @@ class GDPRComplianceManager:
     def record_consent(self, consent: ConsentRecord) -> str:
         """Record consent from a data subject"""
         if consent.status == ConsentStatus.GIVEN:
-            consent.given_at = datetime.utcnow()
+            consent.given_at_us = _now_us()
         
         self.consent_records[consent.consent_id] = consent
         
@@ -420,7 +681,10 @@ class GDPRComplianceManager:
     def record_personal_data(self, data_record: PersonalDataRecord) -> str:
         """Record personal data being processed"""
         self.personal_data_records[data_record.record_id] = data_record
-        
+        if data_record.expires_at_us is not None:
+            heapq.heappush(self._expiry_heap,
+                           (data_record.expires_at_us, data_record.record_id))
+
         # Log the data collection
         self.log_processing_activity(
             subject_id=data_record.subject_id,
@@ -459,18 +723,9 @@ class GDPRComplianceManager:
         self.subject_requests[request.request_id] = request
         
         # Process the request based on type
-        if request.right_type == DataSubjectRight.ACCESS:
-            self._handle_access_request(request)
-        elif request.right_type == DataSubjectRight.RECTIFICATION:
-            self._handle_rectification_request(request)
-        elif request.right_type == DataSubjectRight.ERASURE:
-            self._handle_erasure_request(request)
-        elif request.right_type == DataSubjectRight.DATA_PORTABILITY:
-            self._handle_portability_request(request)
-        elif request.right_type == DataSubjectRight.RESTRICT_PROCESSING:
-            self._handle_restriction_request(request)
-        elif request.right_type == DataSubjectRight.OBJECT:
-            self._handle_objection_request(request)
+        handler = self._request_handlers.get(request.right_type)
+        if handler:
+            handler(request)
         
         self.logger.info(f"Handled subject request: {request.request_id} of type: {request.right_type.value}")
         return request.request_id
@@ -517,8 +772,8 @@ class GDPRComplianceManager:
                     "timestamp": log.timestamp.isoformat(),
                     "processor": log.processor
                 }
-                for log in self.processing_logs
-                if log.subject_id == subject_id and log.timestamp > twelve_months_ago
+                for log in self.processing_logs.entries_since(
+                    twelve_months_ago, subject_id=subject_id)
             ]
             
             request.response_data = {
@@ -530,7 +785,7 @@ class GDPRComplianceManager:
             }
             
             request.status = "completed"
-            request.completion_date = datetime.utcnow()
+            request.completion_date_us = _now_us()
             
         except Exception as e:
             request.status = "error"
@@ -554,7 +809,7 @@ class GDPRComplianceManager:
                 )
                 
                 request.status = "completed"
-                request.completion_date = datetime.utcnow()
+                request.completion_date_us = _now_us()
             else:
                 request.status = "error"
                 
@@ -568,8 +823,18 @@ class GDPRComplianceManager:
             categories = request.details.get('categories')
             if categories:
                 categories = [DataCategory(cat) for cat in categories]
-            
-            success = self.data_processor.delete_personal_data(request.subject_id, categories)
+
+            if categories and len(categories) > 1:
+                # Fan per-category deletes out over the I/O pool; each call
+                # hits the (potentially remote) data store independently.
+                results = self._io_pool.map(
+                    lambda category: self.data_processor.delete_personal_data(
+                        request.subject_id, [category]),
+                    categories)
+                success = all(results)
+            else:
+                success = self.data_processor.delete_personal_data(
+                    request.subject_id, categories)
             
             if success:
                 # Log the erasure
@@ -583,7 +848,7 @@ class GDPRComplianceManager:
                 )
                 
                 request.status = "completed"
-                request.completion_date = datetime.utcnow()
+                request.completion_date_us = _now_us()
             else:
                 request.status = "error"
                 
@@ -619,7 +884,7 @@ class GDPRComplianceManager:
             )
             
             request.status = "completed"
-            request.completion_date = datetime.utcnow()
+            request.completion_date_us = _now_us()
             
         except Exception as e:
             request.status = "error"
@@ -640,7 +905,7 @@ class GDPRComplianceManager:
             )
             
             request.status = "completed"
-            request.completion_date = datetime.utcnow()
+            request.completion_date_us = _now_us()
             
         except Exception as e:
             request.status = "error"
@@ -662,7 +927,7 @@ class GDPRComplianceManager:
             )
             
             request.status = "completed"
-            request.completion_date = datetime.utcnow()
+            request.completion_date_us = _now_us()
             
         except Exception as e:
             request.status = "error"
@@ -670,9 +935,10 @@ class GDPRComplianceManager:
     
     def generate_compliance_report(self) -> Dict[str, Any]:
         """Generate GDPR compliance report"""
+        now = datetime.utcnow()
         total_subjects = len(self.subjects)
-        active_consents = sum(1 for consent in self.consent_records.values() if consent.is_valid())
-        expired_data = sum(1 for record in self.personal_data_records.values() if record.is_expired())
+        active_consents = ConsentRecord.count_valid(self.consent_records.values(), now)
+        expired_data = PersonalDataRecord.count_expired(self.personal_data_records.values(), now)
         
         # Rights requests summary
         requests_by_type = {}
@@ -695,10 +961,16 @@ class GDPRComplianceManager:
                 "purpose": log.purpose,
                 "timestamp": log.timestamp.isoformat()
             }
-            for log in self.processing_logs
-            if log.timestamp > thirty_days_ago
+            for log in self.processing_logs.entries_since(thirty_days_ago)
         ]
         
+        # One pass over the records fills both distinct-value sets.
+        categories_processed: Set[str] = set()
+        legal_bases_used: Set[str] = set()
+        for record in self.personal_data_records.values():
+            categories_processed.add(record.data_category.sv)
+            legal_bases_used.add(record.legal_basis.sv)
+
         return {
             "report_generated_at": datetime.utcnow().isoformat(),
             "summary": {
@@ -712,26 +984,27 @@ class GDPRComplianceManager:
             },
             "rights_requests": requests_by_type,
             "recent_processing_activities": recent_activities[:50],  # Last 50 activities
-            "data_categories_processed": list(set(
-                record.data_category.value for record in self.personal_data_records.values()
-            )),
-            "legal_bases_used": list(set(
-                record.legal_basis.value for record in self.personal_data_records.values()
-            ))
+            "data_categories_processed": list(categories_processed),
+            "legal_bases_used": list(legal_bases_used)
         }
     
     def cleanup_expired_data(self) -> int:
         """Clean up expired personal data records"""
         expired_count = 0
-        
-        for record in list(self.personal_data_records.values()):
-            if record.is_expired():
+        now_us = _now_us()
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now_us:
+            _, record_id = heapq.heappop(self._expiry_heap)
+            record = self.personal_data_records.get(record_id)
+            # Re-check: the record may have been erased early (e.g. by an
+            # erasure request) or re-recorded with a fresh retention period.
+            if record is not None and record.is_expired():
                 # Delete the actual data
                 success = self.data_processor.delete_personal_data(
-                    record.subject_id, 
+                    record.subject_id,
                     [record.data_category]
                 )
-                
+
                 if success:
                     # Log the automatic deletion
                     self.log_processing_activity(
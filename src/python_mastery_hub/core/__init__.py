@@ -13,7 +13,11 @@ logger = logging.getLogger(__name__)
 
 class LearningModule(ABC):
     """Abstract base class for all learning modules."""
-    
+
+    # Class-level default so callers can test `module.exercises` directly
+    # without hasattr probes, even on subclasses that skip __init__.
+    exercises: List[Dict[str, Any]] = []
+
     def __init__(self, name: str, description: str, difficulty: str):
         self.name = name
         self.description = description
@@ -5,52 +5,81 @@ This module provides interactive learning for Python basics including variables,
 data types, control flow, functions, and error handling.
 """
 
-from .variables_concepts import VariablesConcepts
-from .data_types_concepts import DataTypesConcepts
-from .control_flow_concepts import ControlFlowConcepts
-from .functions_concepts import FunctionsConcepts
-from .error_handling_concepts import ErrorHandlingConcepts
+from importlib import import_module
+
+# Sub-concept classes are imported lazily (PEP 562) so CLI commands that
+# never touch basics don't pay their import cost.
+_CONCEPT_MODULES = {
+    "VariablesConcepts": ".variables_concepts",
+    "DataTypesConcepts": ".data_types_concepts",
+    "ControlFlowConcepts": ".control_flow_concepts",
+    "FunctionsConcepts": ".functions_concepts",
+    "ErrorHandlingConcepts": ".error_handling_concepts",
+}
+
+_TOPIC_CLASSES = {
+    "variables": "VariablesConcepts",
+    "data_types": "DataTypesConcepts",
+    "control_flow": "ControlFlowConcepts",
+    "functions": "FunctionsConcepts",
+    "error_handling": "ErrorHandlingConcepts",
+}
+
+
+def __getattr__(name):
+    if name in _CONCEPT_MODULES:
+        return getattr(import_module(_CONCEPT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Main module class that aggregates all concepts
 class BasicsConcepts:
     """Interactive learning module for Python basics."""
-    
+
+    # Matches the LearningModule default so `module.exercises` is always a
+    # plain attribute lookup for CLI callers.
+    exercises = []
+
     def __init__(self):
         self.name = "Python Basics"
         self.description = "Comprehensive coverage of Python fundamentals"
         self.difficulty = "beginner"
-        
-        # Initialize concept modules
-        self.variables = VariablesConcepts()
-        self.data_types = DataTypesConcepts()
-        self.control_flow = ControlFlowConcepts()
-        self.functions = FunctionsConcepts()
-        self.error_handling = ErrorHandlingConcepts()
-    
+
+        # Concept modules are constructed on first use.
+        self._concepts = {}
+
+        # Cache demonstrate() payloads per topic - they are pure, and the
+        # CLI asks for the same topic repeatedly (overview table + drill-in).
+        self._demo_cache = {}
+
+    def _get_concept(self, topic):
+        """Lazily construct the concept object for a topic."""
+        if topic not in _TOPIC_CLASSES:
+            raise ValueError(f"Topic '{topic}' not found in basics module")
+
+        if topic not in self._concepts:
+            self._concepts[topic] = __getattr__(_TOPIC_CLASSES[topic])()
+        return self._concepts[topic]
+
     def get_topics(self):
         """Return list of available topics."""
         return ["variables", "data_types", "control_flow", "functions", "error_handling"]
-    
+
     def demonstrate(self, topic):
         """Demonstrate a specific topic."""
-        modules = {
-            "variables": self.variables,
-            "data_types": self.data_types,
-            "control_flow": self.control_flow,
-            "functions": self.functions,
-            "error_handling": self.error_handling
-        }
-        
-        if topic not in modules:
-            raise ValueError(f"Topic '{topic}' not found in basics module")
-        
-        return modules[topic].demonstrate()
+        if topic not in self._demo_cache:
+            self._demo_cache[topic] = self._get_concept(topic).demonstrate()
+        return self._demo_cache[topic]
+
+    def get_topic_summary(self, topic):
+        """Return just a topic's explanation without building the full payload."""
+        return self._get_concept(topic)._get_explanation()
 
 __all__ = [
     "BasicsConcepts",
-    "VariablesConcepts", 
+    "VariablesConcepts",
     "DataTypesConcepts",
     "ControlFlowConcepts",
     "FunctionsConcepts",
     "ErrorHandlingConcepts"
-]
\ No newline at end of file
+]
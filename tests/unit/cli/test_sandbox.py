@@ -0,0 +1,62 @@
+# tests/unit/cli/test_sandbox.py
+"""
+Test module for the restricted execution sandbox used by CLI code examples.
+Verifies every shipped example in every registered module runs under the
+sandbox and that disallowed imports and builtins stay out of it.
+"""
+
+import contextlib
+import io
+
+import pytest
+
+main = pytest.importorskip("python_mastery_hub.cli.main")
+core = pytest.importorskip("python_mastery_hub.core")
+
+
+def _example_params():
+    params = []
+    for module_name in core.MODULE_REGISTRY:
+        module = core.get_module(module_name)
+        for topic in module.get_topics():
+            try:
+                data = module.demonstrate(topic)
+            except Exception:
+                continue
+            examples = data.get("examples", {}) if isinstance(data, dict) else {}
+            for name, example in examples.items():
+                code = example.get("code") if isinstance(example, dict) else None
+                if code:
+                    params.append(
+                        pytest.param(code, id=f"{module_name}-{topic}-{name}")
+                    )
+    return params
+
+
+class TestExampleSandbox:
+    @pytest.mark.parametrize("code", _example_params())
+    def test_shipped_example_executes_under_sandbox(self, code):
+        safe_globals = main._SAFE_GLOBALS_TEMPLATE.copy()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                exec(compile(code, "<example>", "exec"), safe_globals)
+        except Exception as exc:
+            # The sandbox must not be the cause: the example has to fail
+            # identically with unrestricted builtins.
+            with pytest.raises(type(exc)):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    exec(compile(code, "<example>", "exec"), {})
+
+    def test_disallowed_import_is_refused(self):
+        with pytest.raises(ImportError):
+            exec("import subprocess", main._SAFE_GLOBALS_TEMPLATE.copy())
+
+    def test_allowed_import_succeeds(self):
+        safe_globals = main._SAFE_GLOBALS_TEMPLATE.copy()
+        exec("from collections import namedtuple", safe_globals)
+        assert "namedtuple" in safe_globals
+
+    def test_real_builtins_stay_out_of_the_sandbox(self):
+        assert main._SAFE_GLOBALS_TEMPLATE["__builtins__"] is main._SAFE_BUILTINS
+        for name in ("open", "eval", "exec", "input", "compile", "breakpoint"):
+            assert name not in main._SAFE_BUILTINS
@@ -0,0 +1,111 @@
+# tests/unit/security/test_access_control.py
+"""Regression tests for packed-permission collision handling in RBAC.
+
+Permissions are packed into single ints with a 16-bit resource-id hash
+(see ``pack_permission``), so two different resource ids can share a
+packed key and a scoped grant must never alias the wildcard key.
+"""
+
+import itertools
+
+import pytest
+
+from security.policies.access_control import (
+    AccessControlManager,
+    AccessDecision,
+    AccessRequest,
+    Action,
+    Permission,
+    ResourceType,
+    pack_permission,
+)
+
+
+def _colliding_resource_ids():
+    """Find two resource ids whose hashes collide in the low 16 bits."""
+    seen = {}
+    for i in itertools.count():
+        resource_id = f"doc{i}"
+        bucket = hash(resource_id) & 0xFFFF
+        if bucket in seen and seen[bucket] != resource_id:
+            return seen[bucket], resource_id
+        seen[bucket] = resource_id
+
+
+def _zero_hash_resource_id():
+    """Find a resource id whose 16-bit hash is 0 (the old wildcard alias)."""
+    for i in itertools.count():
+        resource_id = f"res{i}"
+        if hash(resource_id) & 0xFFFF == 0:
+            return resource_id
+
+
+@pytest.fixture
+def manager():
+    mgr = AccessControlManager()
+    mgr.role_manager.create_role("tester", "Collision regression role")
+    mgr.create_user("u1", "user1", "user1@example.com", roles=["tester"])
+    return mgr
+
+
+class TestPackedPermissionCollisions:
+    def test_scoped_pack_never_equals_wildcard_pack(self):
+        resource_id = _zero_hash_resource_id()
+        scoped = pack_permission(Action.DELETE, ResourceType.DOCUMENT, resource_id)
+        wildcard = pack_permission(Action.DELETE, ResourceType.DOCUMENT)
+        assert scoped != wildcard
+
+    def test_zero_hash_grant_does_not_permit_other_resources(self, manager):
+        resource_id = _zero_hash_resource_id()
+        manager.role_manager.add_permission_to_role(
+            "tester", Permission(Action.DELETE, ResourceType.DOCUMENT, resource_id)
+        )
+
+        granted, _ = manager.check_access(
+            AccessRequest("u1", Action.DELETE, ResourceType.DOCUMENT, resource_id)
+        )
+        assert granted == AccessDecision.PERMIT
+
+        denied, reason = manager.check_access(
+            AccessRequest("u1", Action.DELETE, ResourceType.DOCUMENT, "unrelated")
+        )
+        assert denied == AccessDecision.DENY
+        assert "Wildcard" not in reason
+
+    def test_colliding_grants_coexist_in_one_role(self, manager):
+        id_a, id_b = _colliding_resource_ids()
+        manager.role_manager.add_permission_to_role(
+            "tester", Permission(Action.READ, ResourceType.DOCUMENT, id_a)
+        )
+        manager.role_manager.add_permission_to_role(
+            "tester", Permission(Action.READ, ResourceType.DOCUMENT, id_b)
+        )
+
+        for resource_id in (id_a, id_b):
+            decision, reason = manager.check_access(
+                AccessRequest("u1", Action.READ, ResourceType.DOCUMENT, resource_id)
+            )
+            assert decision == AccessDecision.PERMIT, resource_id
+            assert reason == "Direct permission match"
+
+    def test_removing_one_colliding_grant_keeps_the_other(self, manager):
+        id_a, id_b = _colliding_resource_ids()
+        manager.role_manager.add_permission_to_role(
+            "tester", Permission(Action.READ, ResourceType.DOCUMENT, id_a)
+        )
+        manager.role_manager.add_permission_to_role(
+            "tester", Permission(Action.READ, ResourceType.DOCUMENT, id_b)
+        )
+        manager.role_manager.remove_permission_from_role(
+            "tester", Permission(Action.READ, ResourceType.DOCUMENT, id_a)
+        )
+
+        removed, _ = manager.check_access(
+            AccessRequest("u1", Action.READ, ResourceType.DOCUMENT, id_a)
+        )
+        assert removed == AccessDecision.DENY
+
+        kept, _ = manager.check_access(
+            AccessRequest("u1", Action.READ, ResourceType.DOCUMENT, id_b)
+        )
+        assert kept == AccessDecision.PERMIT